@@ -9,7 +9,7 @@ from src.data_model.models import MRRTier
 from src.market_intel import TAMCalculator, MarketModel
 from src.segmentation import MRRTierClassifier, SegmentView
 from src.segmentation.views import SegmentSummary, SegmentViewBuilder
-from src.playbook import Playbook, PlaybookGenerator, TemplateRegistry
+from src.playbook import Playbook, PlaybookGenerator, get_template_registry
 from src.playbook.models import ApprovalStatus
 from src.admin import AdminConfigStore, DataSourceLevel
 
@@ -84,7 +84,7 @@ class GeneratePlaybookRequest(BaseModel):
 
 _playbooks: dict[str, Playbook] = {}
 _tam_calculator = TAMCalculator()
-_template_registry = TemplateRegistry()
+_template_registry = get_template_registry()
 _playbook_generator = PlaybookGenerator(template_registry=_template_registry)
 _admin_store = AdminConfigStore()
 
@@ -278,7 +278,7 @@ async def generate_enterprise_strategy(request: Optional[GeneratePlaybookRequest
     # Mock segment views (in production, from database)
     segment_views: List[SegmentView] = []  # Would be populated from data
 
-    playbook = _playbook_generator.generate_enterprise_strategy(
+    playbook = await _playbook_generator.agenerate_enterprise_strategy(
         market_model=market_model,
         segment_views=segment_views,
         growth_target_pct=0.15,
@@ -329,7 +329,7 @@ async def generate_segment_playbook(tier: str, request: Optional[GeneratePlayboo
 
     market_model = _tam_calculator.build_market_model(year=2025)
 
-    playbook = _playbook_generator.generate_segment_playbook(
+    playbook = await _playbook_generator.agenerate_segment_playbook(
         segment_view=segment_view,
         market_model=market_model,
         owner_name="Demo User",
@@ -33,3 +33,14 @@ def db_save(key: str, value):
                 db.add(AppConfigDB(key=key, value=value))
     except Exception as e:
         logger.warning(f"Could not save '{key}' to database: {e}")
+
+
+def db_delete(key: str) -> None:
+    """Delete a value from the AppConfigDB key-value store."""
+    try:
+        from src.database import get_db
+        from src.db_models import AppConfigDB
+        with get_db() as db:
+            db.query(AppConfigDB).filter_by(key=key).delete()
+    except Exception as e:
+        logger.warning(f"Could not delete '{key}' from database: {e}")
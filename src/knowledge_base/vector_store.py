@@ -58,34 +58,54 @@ class KnowledgeBaseVectorStore:
         source_type: Optional[str] = None,
     ) -> List[tuple[SourceChunk, float]]:
         """Query the knowledge base and return ranked chunks with scores."""
+        return self.query_batch([query_text], n_results=n_results, source_type=source_type)[0]
+
+    def query_batch(
+        self,
+        query_texts: List[str],
+        n_results: int = 5,
+        source_type: Optional[str] = None,
+    ) -> List[List[tuple[SourceChunk, float]]]:
+        """
+        Query the knowledge base with several queries in one call.
+
+        Embedding and nearest-neighbour search run once for the whole batch.
+        Returns ranked chunks with scores for each query, in query order.
+        """
+        if not query_texts:
+            return []
+
         where_filter = None
         if source_type:
             where_filter = {"source_type": source_type}
 
         results = self.collection.query(
-            query_texts=[query_text],
+            query_texts=query_texts,
             n_results=n_results,
             where=where_filter,
             include=["documents", "metadatas", "distances"],
         )
 
-        chunks_with_scores: List[tuple[SourceChunk, float]] = []
-        for i, doc_id in enumerate(results["ids"][0]):
-            meta = results["metadatas"][0][i]
-            content = results["documents"][0][i]
-            distance = results["distances"][0][i] if results.get("distances") else 0.0
-
-            chunk = SourceChunk(
-                id=doc_id,
-                source_id=meta.get("source_id", ""),
-                chunk_index=int(meta.get("chunk_index", 0)),
-                content=content,
-                section=meta.get("section"),
-                metadata={k: v for k, v in meta.items() if k not in ("source_id", "chunk_index", "section")},
-            )
-            chunks_with_scores.append((chunk, distance))
-
-        return chunks_with_scores
+        batch: List[List[tuple[SourceChunk, float]]] = []
+        for q, ids in enumerate(results["ids"]):
+            chunks_with_scores: List[tuple[SourceChunk, float]] = []
+            for i, doc_id in enumerate(ids):
+                meta = results["metadatas"][q][i]
+                content = results["documents"][q][i]
+                distance = results["distances"][q][i] if results.get("distances") else 0.0
+
+                chunk = SourceChunk(
+                    id=doc_id,
+                    source_id=meta.get("source_id", ""),
+                    chunk_index=int(meta.get("chunk_index", 0)),
+                    content=content,
+                    section=meta.get("section"),
+                    metadata={k: v for k, v in meta.items() if k not in ("source_id", "chunk_index", "section")},
+                )
+                chunks_with_scores.append((chunk, distance))
+            batch.append(chunks_with_scores)
+
+        return batch
 
     def create_citation(self, chunk: SourceChunk, excerpt_length: int = 150) -> Citation:
         """Create a Citation object for a retrieved chunk."""
@@ -112,6 +132,10 @@ class KnowledgeBaseVectorStore:
             excerpt=chunk.content[:excerpt_length] + "..." if len(chunk.content) > excerpt_length else chunk.content,
         )
 
+    def chunk_count(self) -> int:
+        """Number of chunks in the collection; changes whenever content is ingested."""
+        return self.collection.count()
+
     def persist(self) -> None:
         """Persist the vector store to disk."""
         self.client.persist()
@@ -6,7 +6,7 @@ from .models import (
     PlaybookVersion,
     ApprovalStatus,
 )
-from .templates import PlaybookTemplate, TemplateRegistry
+from .templates import PlaybookTemplate, TemplateRegistry, get_template_registry
 from .generator import PlaybookGenerator
 from .llm_assistant import LLMPlaybookAssistant
 
@@ -17,6 +17,7 @@ __all__ = [
     "ApprovalStatus",
     "PlaybookTemplate",
     "TemplateRegistry",
+    "get_template_registry",
     "PlaybookGenerator",
     "LLMPlaybookAssistant",
 ]
@@ -1,18 +1,312 @@
 """Playbook generator: orchestrates template + data + LLM to produce playbooks."""
 
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 from datetime import datetime
+import asyncio
 import hashlib
 
 from .models import Playbook, PlaybookSection, PlaybookVersion, ApprovalStatus
-from .templates import PlaybookTemplate, TemplateRegistry, SectionTemplate
-from .llm_assistant import LLMPlaybookAssistant
+from .templates import PlaybookTemplate, TemplateRegistry, SectionTemplate, get_template_registry
+from .llm_assistant import LLMPlaybookAssistant, LLMGenerationRequest
 
-from src.knowledge_base.models import Citation
-from src.market_intel.models import MarketModel, Assumption
+from src.market_intel.models import MarketModel, MarketSegment, Assumption
 from src.segmentation.views import SegmentView
 
 
+# Static section content, built once at import rather than on every section.
+# Each entry maps section_type -> (narrative, key_points).
+_ENTERPRISE_STATIC_SECTIONS: Dict[str, Tuple[str, Tuple[str, ...]]] = {
+    "operating_model": (
+        "The AI-enabled operating model transforms GTM, Delivery, and Support. "
+        "AI agents assist (not replace) humans across the first 10 growth-acceleration workflows.",
+        (
+            "GTM: Account planning, proposal generation, quote building with guardrails",
+            "Delivery: Order validation, provisioning status, scheduling",
+            "Support: Voice triage with transactions, case routing, config changes",
+            "Governance: Human accountability, policy guardrails, audit trails",
+        ),
+    ),
+    "roadmap": (
+        "Implementation follows a phased approach: Phase 0 (definition), "
+        "Phase 1 (MVP), Phase 2 (agent scaling), Phase 3 (continuous learning).",
+        (
+            "Phase 0 (2-4 weeks): Data mapping, KPI definitions, knowledge base curation",
+            "Phase 1 (6-10 weeks): Strategy deck generator, segment playbooks, first 10 workflows",
+            "Phase 2 (8-12 weeks): Agent scaling, execution integration, cost-to-serve optimization",
+            "Phase 3 (ongoing): Experiment framework, playbook versioning, performance tracking",
+        ),
+    ),
+}
+
+_EXECUTIVE_SUMMARY_KEY_POINTS: Tuple[str, ...] = (
+    "Primary levers: attach (SD-WAN/SASE), expansion, churn reduction",
+    "AI-enabled operating model to scale without linear headcount growth",
+)
+
+_GROWTH_MODEL_KEY_POINTS: Tuple[str, ...] = (
+    "New logo ARR: target high-potential accounts with Connectivity + SD-WAN bundle",
+    "Expansion ARR: trigger-based plays for SD-WAN → SASE attach",
+    "Churn reduction: proactive intervention for at-risk accounts",
+    "Pricing uplift: capture value in renewals",
+)
+
+# Prompt context keys that carry useful search terms for knowledge base retrieval
+_RETRIEVAL_QUERY_KEYS: Dict[str, List[str]] = {
+    "executive_summary": ["top_segments"],
+    "segment_overview": ["tier_label"],
+}
+
+_SEGMENT_STATIC_SECTIONS: Dict[str, Tuple[str, Tuple[str, ...]]] = {
+    "solution_bundles": (
+        "The recommended solution path for this segment is Connectivity → SD-WAN → SASE.",
+        (
+            "Primary bundle: Dedicated Internet + SD-WAN",
+            "Upsell: SASE/security wrap",
+            "Cross-sell: Managed services for operations",
+            "Value prop: Reliability, security, simplified operations",
+        ),
+    ),
+    "acquisition_plays": (
+        "Acquisition plays focus on high-intent prospects with attach potential.",
+        (
+            "Play 1: Competitive displacement (legacy MPLS → SD-WAN)",
+            "Play 2: Digital-first prospecting with AI-assisted outreach",
+            "Play 3: Partner-led referral with co-sell support",
+        ),
+    ),
+    "expansion_plays": (
+        "Expansion triggers include bandwidth utilization, contract renewals, and new sites.",
+        (
+            "Trigger: High bandwidth utilization → upgrade offer",
+            "Trigger: Renewal window → SD-WAN/SASE bundle",
+            "Trigger: New site added → expansion quote",
+            "Motion: Quarterly business review with expansion recommendations",
+        ),
+    ),
+    "retention_plays": (
+        "Retention plays focus on early intervention for at-risk accounts.",
+        (
+            "Signal: Declining usage or engagement → proactive outreach",
+            "Signal: Recent incidents → executive review and remediation",
+            "Signal: Approaching contract end without renewal → save motion",
+            "Motion: Health score monitoring with automated alerts",
+        ),
+    ),
+    "channel_capacity": (
+        "Channel mix and capacity model for this segment.",
+        (
+            "Primary channel: Direct enterprise sales",
+            "Supporting: Partner/agent for new logo sourcing",
+            "Digital: AI-assisted prospecting and proposal generation",
+            "Rep productivity target: $X ARR per rep per quarter",
+        ),
+    ),
+    "kpis": (
+        "Key metrics to track segment performance and playbook effectiveness.",
+        (
+            "Leading: Pipeline coverage, attach rate, quote velocity",
+            "Lagging: New logo ARR, expansion ARR, NRR, churn rate",
+            "Operational: Sales cycle days, quote-to-cash days, incident rate",
+        ),
+    ),
+}
+
+
+# Section content returned by handlers: (narrative, key_points, exhibits, assumptions).
+# Handlers may return shared lists (e.g. market_model.global_assumptions) for
+# assumptions; PlaybookSection validation builds the section's own list.
+SectionContent = Tuple[str, List[str], List[Dict[str, Any]], List[Assumption]]
+
+
+def _segment_totals(segment_views: List[SegmentView]) -> Tuple[float, int]:
+    """
+    Total ARR and account count across segments, in a single pass.
+
+    Segment views are bounded by the five enterprise MRR tiers, so a plain
+    loop is cheaper than materializing arrays for a vectorized reduction.
+    """
+    total_arr = 0.0
+    total_accounts = 0
+    for sv in segment_views:
+        sv_summary = sv.summary
+        total_arr += sv_summary.total_arr_usd
+        total_accounts += sv_summary.account_count
+    return total_arr, total_accounts
+
+
+def _static_section_handler(content: Tuple[str, Tuple[str, ...]]):
+    """Build a section handler that returns fixed narrative and key points."""
+    narrative, key_points = content
+
+    def handler(*_args: Any) -> SectionContent:
+        return narrative, list(key_points), [], []
+
+    return handler
+
+
+# ── Enterprise strategy section handlers ──
+
+
+def _executive_summary_section(
+    market_model: MarketModel,
+    segment_views: List[SegmentView],
+    growth_target_pct: float,
+) -> SectionContent:
+    total_arr, total_accounts = _segment_totals(segment_views)
+    narrative = (
+        f"Comcast Business Enterprise represents ${total_arr/1e9:.1f}B in ARR across "
+        f"{total_accounts:,} accounts. "
+        f"To achieve {growth_target_pct*100:.0f}% annual growth, we must focus on: "
+        f"(1) accelerating SD-WAN/SASE attach, (2) reducing churn in mid-market tiers, "
+        f"(3) scaling AI-assisted sales and support."
+    )
+    key_points = [
+        f"Target: {growth_target_pct*100:.0f}% YoY enterprise growth for 5 years",
+        *_EXECUTIVE_SUMMARY_KEY_POINTS,
+    ]
+    return narrative, key_points, [], []
+
+
+def _market_overview_section(
+    market_model: MarketModel,
+    segment_views: List[SegmentView],
+    growth_target_pct: float,
+) -> SectionContent:
+    narrative = ""
+    assumptions: List[Assumption] = []
+    tam_summary = market_model.tam_estimates[0] if market_model.tam_estimates else None
+    if tam_summary:
+        narrative = (
+            f"The US enterprise connectivity and security market represents a "
+            f"${tam_summary.tam_usd/1e9:.0f}B+ TAM. Key trends include SD-WAN/SASE convergence "
+            f"(18-22% CAGR), managed services growth, and AI-driven operations."
+        )
+        assumptions = market_model.global_assumptions
+
+    key_points = [t.title for t in market_model.trends[:5]]
+
+    exhibits: List[Dict[str, Any]] = [{
+        "type": "tam_waterfall",
+        "title": "Enterprise Market TAM by Solution",
+        "data": [
+            {"solution": e.solution_area.value, "tam_usd": e.tam_usd}
+            for e in market_model.tam_estimates
+            if e.segment is MarketSegment.ENTERPRISE_TOTAL
+        ],
+    }]
+    return narrative, key_points, exhibits, assumptions
+
+
+def _segment_analysis_section(
+    market_model: MarketModel,
+    segment_views: List[SegmentView],
+    growth_target_pct: float,
+) -> SectionContent:
+    narrative = "Enterprise segments by MRR tier show distinct growth and risk profiles."
+    key_points: List[str] = []
+    revenue_data: List[Dict[str, Any]] = []
+    for sv in segment_views:
+        sv_summary = sv.summary
+        key_points.append(
+            f"{sv_summary.tier_label}: {sv_summary.account_count:,} accounts, "
+            f"${sv_summary.total_arr_usd/1e6:.1f}M ARR"
+        )
+        revenue_data.append({"tier": sv.tier.value, "arr_usd": sv_summary.total_arr_usd})
+
+    exhibits: List[Dict[str, Any]] = [{
+        "type": "segment_revenue_chart",
+        "title": "ARR by Segment",
+        "data": revenue_data,
+    }]
+    return narrative, key_points, exhibits, []
+
+
+def _growth_model_section(
+    market_model: MarketModel,
+    segment_views: List[SegmentView],
+    growth_target_pct: float,
+) -> SectionContent:
+    narrative = (
+        f"Achieving {growth_target_pct*100:.0f}% growth requires a balanced approach: "
+        f"~40% from new logos, ~40% from expansion/attach, ~20% from churn reduction."
+    )
+    return narrative, list(_GROWTH_MODEL_KEY_POINTS), [], []
+
+
+def _appendix_section(
+    market_model: MarketModel,
+    segment_views: List[SegmentView],
+    growth_target_pct: float,
+) -> SectionContent:
+    narrative = "This appendix contains data sources, assumptions, and methodology details."
+    return narrative, [], [], market_model.global_assumptions
+
+
+def _empty_section(*_args: Any) -> SectionContent:
+    """Fallback for section types without a handler."""
+    return "", [], [], []
+
+
+_ENTERPRISE_SECTION_HANDLERS = {
+    "executive_summary": _executive_summary_section,
+    "market_overview": _market_overview_section,
+    "segment_analysis": _segment_analysis_section,
+    "growth_model": _growth_model_section,
+    "appendix": _appendix_section,
+    **{
+        section_type: _static_section_handler(content)
+        for section_type, content in _ENTERPRISE_STATIC_SECTIONS.items()
+    },
+}
+
+
+# ── Segment playbook section handlers ──
+
+
+def _segment_overview_section(
+    segment_view: SegmentView,
+    market_model: Optional[MarketModel],
+) -> SectionContent:
+    summary = segment_view.summary
+    narrative = (
+        f"The {summary.tier_label} segment includes {summary.account_count:,} accounts "
+        f"representing ${summary.total_arr_usd/1e6:.1f}M in ARR. "
+        f"Average MRR is ${summary.avg_mrr_usd:,.0f}."
+    )
+    key_points: List[str] = []
+    if summary.avg_growth_potential:
+        key_points.append(f"Avg growth potential score: {summary.avg_growth_potential:.2f}")
+    if summary.avg_churn_risk:
+        key_points.append(f"Avg churn risk score: {summary.avg_churn_risk:.2f}")
+    if summary.high_priority_accounts:
+        key_points.append(f"High-priority accounts: {summary.high_priority_accounts}")
+    return narrative, key_points, [], []
+
+
+def _icp_section(
+    segment_view: SegmentView,
+    market_model: Optional[MarketModel],
+) -> SectionContent:
+    narrative = f"The ideal customer in {segment_view.summary.tier_label} has the following characteristics:"
+    key_points = [
+        f"MRR range: ${segment_view.tier_info.min_mrr:,.0f} - ${segment_view.tier_info.max_mrr or 'unlimited':,}" if segment_view.tier_info else "See tier definition",
+        "Multi-site footprint with network-dependent operations",
+        "IT decision-maker with security and reliability priorities",
+        "Growth trajectory indicating expansion potential",
+    ]
+    return narrative, key_points, [], []
+
+
+_SEGMENT_SECTION_HANDLERS = {
+    "segment_overview": _segment_overview_section,
+    "icp": _icp_section,
+    **{
+        section_type: _static_section_handler(content)
+        for section_type, content in _SEGMENT_STATIC_SECTIONS.items()
+    },
+}
+
+
 class PlaybookGenerator:
     """
     Generates playbooks by combining:
@@ -28,13 +322,14 @@ class PlaybookGenerator:
         template_registry: Optional[TemplateRegistry] = None,
         llm_assistant: Optional[LLMPlaybookAssistant] = None,
     ):
-        self.templates = template_registry or TemplateRegistry()
+        self.templates = template_registry or get_template_registry()
         self.llm = llm_assistant  # Can be None for template-only generation
 
     def _generate_id(self, *components: str) -> str:
         """Generate a deterministic ID."""
         combined = "|".join(str(c) for c in components)
-        return hashlib.sha256(combined.encode()).hexdigest()[:12]
+        # Non-cryptographic short ID: a 6-byte BLAKE2b digest gives the same 12 hex chars
+        return hashlib.blake2b(combined.encode(), digest_size=6).hexdigest()
 
     def generate_enterprise_strategy(
         self,
@@ -47,6 +342,10 @@ class PlaybookGenerator:
         """
         Generate an enterprise strategy playbook.
 
+        Template-only generation runs inline; when an LLM assistant is
+        configured this runs `agenerate_enterprise_strategy` to completion.
+        Async callers should await that coroutine directly instead.
+
         Args:
             market_model: TAM/trends data
             segment_views: Segment data with scores
@@ -57,22 +356,78 @@ class PlaybookGenerator:
         Returns:
             A Playbook in draft status
         """
-        template = self.templates.get("enterprise_strategy")
-        if not template:
-            raise ValueError("Enterprise strategy template not found")
+        if self.llm is not None:
+            return asyncio.run(
+                self.agenerate_enterprise_strategy(
+                    market_model=market_model,
+                    segment_views=segment_views,
+                    growth_target_pct=growth_target_pct,
+                    owner_id=owner_id,
+                    owner_name=owner_name,
+                )
+            )
 
-        playbook_id = self._generate_id("enterprise_strategy", datetime.utcnow().isoformat())
+        # Template-only sections are pure-Python CPU work under the GIL, so they
+        # are built inline; a thread pool would add overhead without overlap.
+        template = self._get_template("enterprise_strategy")
+        run_ts = datetime.utcnow().isoformat()
+        sections = [
+            self._generate_section(
+                section_template=section_template,
+                market_model=market_model,
+                segment_views=segment_views,
+                growth_target_pct=growth_target_pct,
+                run_ts=run_ts,
+                section_index=section_index,
+            )
+            for section_index, section_template in enumerate(template.sections)
+        ]
+        return self._build_enterprise_playbook(sections, growth_target_pct, owner_id, owner_name, run_ts)
 
-        sections: List[PlaybookSection] = []
+    async def agenerate_enterprise_strategy(
+        self,
+        market_model: MarketModel,
+        segment_views: List[SegmentView],
+        growth_target_pct: float = 0.15,
+        owner_id: Optional[str] = None,
+        owner_name: Optional[str] = None,
+    ) -> Playbook:
+        """
+        Generate an enterprise strategy playbook with LLM-drafted narratives.
 
-        for section_template in template.sections:
-            section = self._generate_section(
+        Drafts for all sections are requested as one batch, so retrieval runs
+        once per playbook and LLM calls are dispatched concurrently.
+        """
+        template = self._get_template("enterprise_strategy")
+        run_ts = datetime.utcnow().isoformat()
+        sections = [
+            self._generate_section(
                 section_template=section_template,
                 market_model=market_model,
                 segment_views=segment_views,
                 growth_target_pct=growth_target_pct,
+                run_ts=run_ts,
+                section_index=section_index,
             )
-            sections.append(section)
+            for section_index, section_template in enumerate(template.sections)
+        ]
+        contexts = [
+            self._enterprise_prompt_context(section.section_type, market_model, segment_views, growth_target_pct)
+            for section in sections
+        ]
+        await self._apply_llm_drafts(sections, contexts)
+        return self._build_enterprise_playbook(sections, growth_target_pct, owner_id, owner_name, run_ts)
+
+    def _build_enterprise_playbook(
+        self,
+        sections: List[PlaybookSection],
+        growth_target_pct: float,
+        owner_id: Optional[str],
+        owner_name: Optional[str],
+        run_ts: str,
+    ) -> Playbook:
+        """Assemble an enterprise strategy playbook from generated sections."""
+        playbook_id = self._generate_id("enterprise_strategy", run_ts)
 
         return Playbook(
             id=playbook_id,
@@ -95,6 +450,10 @@ class PlaybookGenerator:
         """
         Generate a segment-specific playbook.
 
+        Template-only generation runs inline; when an LLM assistant is
+        configured this runs `agenerate_segment_playbook` to completion.
+        Async callers should await that coroutine directly instead.
+
         Args:
             segment_view: Segment data with accounts and scores
             market_model: Optional market context
@@ -104,23 +463,65 @@ class PlaybookGenerator:
         Returns:
             A Playbook in draft status
         """
-        template = self.templates.get("segment_playbook")
-        if not template:
-            raise ValueError("Segment playbook template not found")
-
-        tier = segment_view.tier.value
-        playbook_id = self._generate_id("segment_playbook", tier, datetime.utcnow().isoformat())
+        if self.llm is not None:
+            return asyncio.run(
+                self.agenerate_segment_playbook(
+                    segment_view=segment_view,
+                    market_model=market_model,
+                    owner_id=owner_id,
+                    owner_name=owner_name,
+                )
+            )
 
-        sections: List[PlaybookSection] = []
+        template = self._get_template("segment_playbook")
+        run_ts = datetime.utcnow().isoformat()
+        sections = [
+            self._generate_segment_section(
+                section_template=section_template,
+                segment_view=segment_view,
+                market_model=market_model,
+                run_ts=run_ts,
+                section_index=section_index,
+            )
+            for section_index, section_template in enumerate(template.sections)
+        ]
+        return self._build_segment_playbook(sections, segment_view, owner_id, owner_name, run_ts)
 
-        for section_template in template.sections:
-            section = self._generate_segment_section(
+    async def agenerate_segment_playbook(
+        self,
+        segment_view: SegmentView,
+        market_model: Optional[MarketModel] = None,
+        owner_id: Optional[str] = None,
+        owner_name: Optional[str] = None,
+    ) -> Playbook:
+        """Generate a segment playbook with LLM-drafted narratives (batched)."""
+        template = self._get_template("segment_playbook")
+        run_ts = datetime.utcnow().isoformat()
+        sections = [
+            self._generate_segment_section(
                 section_template=section_template,
                 segment_view=segment_view,
                 market_model=market_model,
+                run_ts=run_ts,
+                section_index=section_index,
             )
-            sections.append(section)
+            for section_index, section_template in enumerate(template.sections)
+        ]
+        contexts = [self._segment_prompt_context(section.section_type, segment_view) for section in sections]
+        await self._apply_llm_drafts(sections, contexts)
+        return self._build_segment_playbook(sections, segment_view, owner_id, owner_name, run_ts)
 
+    def _build_segment_playbook(
+        self,
+        sections: List[PlaybookSection],
+        segment_view: SegmentView,
+        owner_id: Optional[str],
+        owner_name: Optional[str],
+        run_ts: str,
+    ) -> Playbook:
+        """Assemble a segment playbook from generated sections."""
+        tier = segment_view.tier.value
+        playbook_id = self._generate_id("segment_playbook", tier, run_ts)
         tier_label = segment_view.tier_info.label if segment_view.tier_info else tier
 
         return Playbook(
@@ -135,116 +536,104 @@ class PlaybookGenerator:
             status=ApprovalStatus.DRAFT,
         )
 
+    def _get_template(self, template_id: str) -> PlaybookTemplate:
+        """Look up a playbook template, failing loudly if it is missing."""
+        template = self.templates.get(template_id)
+        if not template:
+            raise ValueError(f"{template_id.replace('_', ' ').capitalize()} template not found")
+        return template
+
+    def _enterprise_prompt_context(
+        self,
+        section_type: str,
+        market_model: MarketModel,
+        segment_views: List[SegmentView],
+        growth_target_pct: float,
+    ) -> Dict[str, Any]:
+        """Build the LLM prompt context for an enterprise strategy section."""
+        if section_type != "executive_summary":
+            return {}
+
+        total_arr, total_accounts = _segment_totals(segment_views)
+        top_segments = sorted(segment_views, key=lambda sv: sv.summary.total_arr_usd, reverse=True)[:3]
+        return {
+            "total_arr": f"{total_arr:,.0f}",
+            "account_count": f"{total_accounts:,}",
+            "growth_target_pct": f"{growth_target_pct*100:.0f}",
+            "top_segments": ", ".join(sv.summary.tier_label for sv in top_segments),
+            "market_trends": "\n".join(f"- {t.title}" for t in market_model.trends[:5]),
+        }
+
+    def _segment_prompt_context(self, section_type: str, segment_view: SegmentView) -> Dict[str, Any]:
+        """Build the LLM prompt context for a segment playbook section."""
+        if section_type != "segment_overview":
+            return {}
+
+        summary = segment_view.summary
+        return {
+            "tier_label": summary.tier_label,
+            "account_count": f"{summary.account_count:,}",
+            "total_arr": f"{summary.total_arr_usd:,.0f}",
+            "avg_mrr": f"{summary.avg_mrr_usd:,.0f}",
+            "growth_potential": f"{summary.avg_growth_potential or 0:.2f}",
+            "churn_risk": f"{summary.avg_churn_risk or 0:.2f}",
+        }
+
+    async def _apply_llm_drafts(
+        self,
+        sections: List[PlaybookSection],
+        contexts: List[Dict[str, Any]],
+    ) -> None:
+        """
+        Replace section narratives with LLM drafts where a prompt exists.
+
+        Sections without an approved prompt (or without context) keep their
+        template narrative. All drafts are requested in a single batch.
+        """
+        if self.llm is None:
+            return
+
+        available_prompts = set(self.llm.get_available_prompts())
+        drafted: List[PlaybookSection] = []
+        requests: List[LLMGenerationRequest] = []
+        for section, context in zip(sections, contexts):
+            if context and section.section_type in available_prompts:
+                drafted.append(section)
+                requests.append(
+                    LLMGenerationRequest(
+                        prompt_template_id=section.section_type,
+                        section_type=section.section_type,
+                        context=context,
+                        query_keys=_RETRIEVAL_QUERY_KEYS.get(section.section_type, []),
+                    )
+                )
+        if not requests:
+            return
+
+        results = await self.llm.generate_batch(requests)
+        for section, result in zip(drafted, results):
+            if result.model == "none":
+                continue
+            section.narrative = result.content
+            section.citations.extend(result.citations)
+            section.llm_generated = True
+            section.llm_model = result.model
+            section.llm_prompt_id = result.prompt_id
+
     def _generate_section(
         self,
         section_template: SectionTemplate,
         market_model: MarketModel,
         segment_views: List[SegmentView],
         growth_target_pct: float,
+        run_ts: str,
+        section_index: int,
     ) -> PlaybookSection:
         """Generate a single section for enterprise strategy."""
-        section_id = self._generate_id(section_template.section_type, datetime.utcnow().isoformat())
-
-        # Build section content based on type
-        narrative = ""
-        key_points: List[str] = []
-        exhibits: List[Dict[str, Any]] = []
-        citations: List[Citation] = []
-        assumptions: List[Assumption] = []
-
-        if section_template.section_type == "executive_summary":
-            total_arr = sum(sv.summary.total_arr_usd for sv in segment_views)
-            narrative = (
-                f"Comcast Business Enterprise represents ${total_arr/1e9:.1f}B in ARR across "
-                f"{sum(sv.summary.account_count for sv in segment_views):,} accounts. "
-                f"To achieve {growth_target_pct*100:.0f}% annual growth, we must focus on: "
-                f"(1) accelerating SD-WAN/SASE attach, (2) reducing churn in mid-market tiers, "
-                f"(3) scaling AI-assisted sales and support."
-            )
-            key_points = [
-                f"Target: {growth_target_pct*100:.0f}% YoY enterprise growth for 5 years",
-                "Primary levers: attach (SD-WAN/SASE), expansion, churn reduction",
-                "AI-enabled operating model to scale without linear headcount growth",
-            ]
-
-        elif section_template.section_type == "market_overview":
-            tam_summary = market_model.tam_estimates[0] if market_model.tam_estimates else None
-            if tam_summary:
-                narrative = (
-                    f"The US enterprise connectivity and security market represents a "
-                    f"${tam_summary.tam_usd/1e9:.0f}B+ TAM. Key trends include SD-WAN/SASE convergence "
-                    f"(18-22% CAGR), managed services growth, and AI-driven operations."
-                )
-                assumptions.extend(market_model.global_assumptions)
-
-            key_points = [t.title for t in market_model.trends[:5]]
-
-            exhibits.append({
-                "type": "tam_waterfall",
-                "title": "Enterprise Market TAM by Solution",
-                "data": [
-                    {"solution": e.solution_area.value, "tam_usd": e.tam_usd}
-                    for e in market_model.tam_estimates
-                    if e.segment.value == "enterprise_total"
-                ],
-            })
-
-        elif section_template.section_type == "segment_analysis":
-            narrative = "Enterprise segments by MRR tier show distinct growth and risk profiles."
-            for sv in segment_views:
-                key_points.append(
-                    f"{sv.summary.tier_label}: {sv.summary.account_count:,} accounts, "
-                    f"${sv.summary.total_arr_usd/1e6:.1f}M ARR"
-                )
+        section_id = self._generate_id(section_template.section_type, run_ts, str(section_index))
 
-            exhibits.append({
-                "type": "segment_revenue_chart",
-                "title": "ARR by Segment",
-                "data": [
-                    {"tier": sv.tier.value, "arr_usd": sv.summary.total_arr_usd}
-                    for sv in segment_views
-                ],
-            })
-
-        elif section_template.section_type == "growth_model":
-            narrative = (
-                f"Achieving {growth_target_pct*100:.0f}% growth requires a balanced approach: "
-                f"~40% from new logos, ~40% from expansion/attach, ~20% from churn reduction."
-            )
-            key_points = [
-                "New logo ARR: target high-potential accounts with Connectivity + SD-WAN bundle",
-                "Expansion ARR: trigger-based plays for SD-WAN → SASE attach",
-                "Churn reduction: proactive intervention for at-risk accounts",
-                "Pricing uplift: capture value in renewals",
-            ]
-
-        elif section_template.section_type == "operating_model":
-            narrative = (
-                "The AI-enabled operating model transforms GTM, Delivery, and Support. "
-                "AI agents assist (not replace) humans across the first 10 growth-acceleration workflows."
-            )
-            key_points = [
-                "GTM: Account planning, proposal generation, quote building with guardrails",
-                "Delivery: Order validation, provisioning status, scheduling",
-                "Support: Voice triage with transactions, case routing, config changes",
-                "Governance: Human accountability, policy guardrails, audit trails",
-            ]
-
-        elif section_template.section_type == "roadmap":
-            narrative = (
-                "Implementation follows a phased approach: Phase 0 (definition), "
-                "Phase 1 (MVP), Phase 2 (agent scaling), Phase 3 (continuous learning)."
-            )
-            key_points = [
-                "Phase 0 (2-4 weeks): Data mapping, KPI definitions, knowledge base curation",
-                "Phase 1 (6-10 weeks): Strategy deck generator, segment playbooks, first 10 workflows",
-                "Phase 2 (8-12 weeks): Agent scaling, execution integration, cost-to-serve optimization",
-                "Phase 3 (ongoing): Experiment framework, playbook versioning, performance tracking",
-            ]
-
-        elif section_template.section_type == "appendix":
-            narrative = "This appendix contains data sources, assumptions, and methodology details."
-            assumptions.extend(market_model.global_assumptions)
+        handler = _ENTERPRISE_SECTION_HANDLERS.get(section_template.section_type, _empty_section)
+        narrative, key_points, exhibits, assumptions = handler(market_model, segment_views, growth_target_pct)
 
         return PlaybookSection(
             id=section_id,
@@ -254,7 +643,7 @@ class PlaybookGenerator:
             narrative=narrative,
             key_points=key_points,
             exhibits=exhibits,
-            citations=citations,
+            citations=[],
             assumptions=assumptions,
             llm_generated=False,
             human_edited=False,
@@ -265,93 +654,19 @@ class PlaybookGenerator:
         section_template: SectionTemplate,
         segment_view: SegmentView,
         market_model: Optional[MarketModel],
+        run_ts: str,
+        section_index: int,
     ) -> PlaybookSection:
         """Generate a single section for a segment playbook."""
         section_id = self._generate_id(
             section_template.section_type,
             segment_view.tier.value,
-            datetime.utcnow().isoformat(),
+            run_ts,
+            str(section_index),
         )
 
-        narrative = ""
-        key_points: List[str] = []
-        exhibits: List[Dict[str, Any]] = []
-        summary = segment_view.summary
-        tier_label = summary.tier_label
-
-        if section_template.section_type == "segment_overview":
-            narrative = (
-                f"The {tier_label} segment includes {summary.account_count:,} accounts "
-                f"representing ${summary.total_arr_usd/1e6:.1f}M in ARR. "
-                f"Average MRR is ${summary.avg_mrr_usd:,.0f}."
-            )
-            if summary.avg_growth_potential:
-                key_points.append(f"Avg growth potential score: {summary.avg_growth_potential:.2f}")
-            if summary.avg_churn_risk:
-                key_points.append(f"Avg churn risk score: {summary.avg_churn_risk:.2f}")
-            if summary.high_priority_accounts:
-                key_points.append(f"High-priority accounts: {summary.high_priority_accounts}")
-
-        elif section_template.section_type == "icp":
-            narrative = f"The ideal customer in {tier_label} has the following characteristics:"
-            key_points = [
-                f"MRR range: ${segment_view.tier_info.min_mrr:,.0f} - ${segment_view.tier_info.max_mrr or 'unlimited':,}" if segment_view.tier_info else "See tier definition",
-                "Multi-site footprint with network-dependent operations",
-                "IT decision-maker with security and reliability priorities",
-                "Growth trajectory indicating expansion potential",
-            ]
-
-        elif section_template.section_type == "solution_bundles":
-            narrative = "The recommended solution path for this segment is Connectivity → SD-WAN → SASE."
-            key_points = [
-                "Primary bundle: Dedicated Internet + SD-WAN",
-                "Upsell: SASE/security wrap",
-                "Cross-sell: Managed services for operations",
-                "Value prop: Reliability, security, simplified operations",
-            ]
-
-        elif section_template.section_type == "acquisition_plays":
-            narrative = "Acquisition plays focus on high-intent prospects with attach potential."
-            key_points = [
-                "Play 1: Competitive displacement (legacy MPLS → SD-WAN)",
-                "Play 2: Digital-first prospecting with AI-assisted outreach",
-                "Play 3: Partner-led referral with co-sell support",
-            ]
-
-        elif section_template.section_type == "expansion_plays":
-            narrative = "Expansion triggers include bandwidth utilization, contract renewals, and new sites."
-            key_points = [
-                "Trigger: High bandwidth utilization → upgrade offer",
-                "Trigger: Renewal window → SD-WAN/SASE bundle",
-                "Trigger: New site added → expansion quote",
-                "Motion: Quarterly business review with expansion recommendations",
-            ]
-
-        elif section_template.section_type == "retention_plays":
-            narrative = "Retention plays focus on early intervention for at-risk accounts."
-            key_points = [
-                "Signal: Declining usage or engagement → proactive outreach",
-                "Signal: Recent incidents → executive review and remediation",
-                "Signal: Approaching contract end without renewal → save motion",
-                "Motion: Health score monitoring with automated alerts",
-            ]
-
-        elif section_template.section_type == "channel_capacity":
-            narrative = "Channel mix and capacity model for this segment."
-            key_points = [
-                "Primary channel: Direct enterprise sales",
-                "Supporting: Partner/agent for new logo sourcing",
-                "Digital: AI-assisted prospecting and proposal generation",
-                "Rep productivity target: $X ARR per rep per quarter",
-            ]
-
-        elif section_template.section_type == "kpis":
-            narrative = "Key metrics to track segment performance and playbook effectiveness."
-            key_points = [
-                "Leading: Pipeline coverage, attach rate, quote velocity",
-                "Lagging: New logo ARR, expansion ARR, NRR, churn rate",
-                "Operational: Sales cycle days, quote-to-cash days, incident rate",
-            ]
+        handler = _SEGMENT_SECTION_HANDLERS.get(section_template.section_type, _empty_section)
+        narrative, key_points, exhibits, assumptions = handler(segment_view, market_model)
 
         return PlaybookSection(
             id=section_id,
@@ -362,7 +677,7 @@ class PlaybookGenerator:
             key_points=key_points,
             exhibits=exhibits,
             citations=[],
-            assumptions=[],
+            assumptions=assumptions,
             llm_generated=False,
             human_edited=False,
         )
@@ -382,7 +697,7 @@ class PlaybookGenerator:
             id=version_id,
             playbook_id=playbook.id,
             version=version,
-            playbook_snapshot=playbook.model_copy(deep=True),
+            playbook_snapshot=Playbook.model_validate_json(playbook.model_dump_json()),
             change_summary=change_summary,
             changed_sections=[s.section_type for s in playbook.sections],
             status=ApprovalStatus.PENDING_REVIEW,
@@ -1,8 +1,13 @@
 """LLM assistant for playbook content generation."""
 
 from typing import Optional, List
-from pydantic import BaseModel, Field
+from pathlib import Path
+from pydantic import BaseModel, ConfigDict, Field
 from datetime import datetime
+import asyncio
+import hashlib
+import json
+import string
 
 from src.knowledge_base.models import Citation
 from src.knowledge_base.vector_store import KnowledgeBaseVectorStore
@@ -11,9 +16,12 @@ from src.knowledge_base.vector_store import KnowledgeBaseVectorStore
 class LLMGenerationRequest(BaseModel):
     """Request for LLM-assisted content generation."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     prompt_template_id: str
     section_type: str
     context: dict = Field(default_factory=dict)
+    query_keys: List[str] = Field(default_factory=list)  # Context keys used in the RAG query
     max_tokens: int = 1000
     temperature: float = 0.7
 
@@ -21,6 +29,8 @@ class LLMGenerationRequest(BaseModel):
 class LLMGenerationResult(BaseModel):
     """Result from LLM generation."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     content: str
     citations: List[Citation] = Field(default_factory=list)
     model: str
@@ -29,6 +39,74 @@ class LLMGenerationResult(BaseModel):
     confidence: float = 0.0  # 0-1, based on retrieval relevance
 
 
+class _PromptContext(dict):
+    """Context mapping for `str.format_map` that leaves unknown fields in place."""
+
+    def __missing__(self, key: str) -> str:
+        return f"{{{key}}}"
+
+
+class LLMGenerationCache:
+    """
+    Content-addressed on-disk cache of LLM generation results.
+
+    Entries are keyed by the prompt template text, the knowledge base state,
+    the section, context and sampling parameters, so identical requests across
+    runs skip both retrieval and the LLM call, while editing a template or
+    ingesting new documents produces fresh drafts.
+    """
+
+    def __init__(self, cache_dir: str):
+        self.cache_dir = Path(cache_dir)
+
+    def key_for(
+        self,
+        request: LLMGenerationRequest,
+        template: str,
+        kb_state: str = "",
+    ) -> str:
+        """Compute the cache key for a generation request."""
+        payload = "|".join([
+            request.prompt_template_id,
+            hashlib.sha256(template.encode()).hexdigest(),
+            kb_state,
+            request.section_type,
+            json.dumps(request.context, sort_keys=True, default=str),
+            ",".join(request.query_keys),
+            str(request.temperature),
+            str(request.max_tokens),
+        ])
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def get(self, key: str) -> Optional[LLMGenerationResult]:
+        """Return the cached result for a key, if present and readable."""
+        path = self.cache_dir / f"{key}.json"
+        if not path.exists():
+            return None
+        try:
+            return LLMGenerationResult.model_validate_json(path.read_text())
+        except (OSError, ValueError):
+            return None
+
+    def put(self, key: str, result: LLMGenerationResult) -> None:
+        """Store a generation result under a key."""
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            path = self.cache_dir / f"{key}.json"
+            path.write_text(result.model_dump_json())
+        except OSError:
+            pass
+
+    def clear(self) -> int:
+        """Remove all cached entries. Returns the number of entries removed."""
+        removed = 0
+        if self.cache_dir.exists():
+            for path in self.cache_dir.glob("*.json"):
+                path.unlink(missing_ok=True)
+                removed += 1
+        return removed
+
+
 class LLMPlaybookAssistant:
     """
     LLM assistant for playbook content generation.
@@ -44,10 +122,28 @@ class LLMPlaybookAssistant:
         self,
         knowledge_base: Optional[KnowledgeBaseVectorStore] = None,
         openai_api_key: Optional[str] = None,
+        cache_dir: Optional[str] = None,
     ):
         self.knowledge_base = knowledge_base
         self.openai_api_key = openai_api_key
+        self.cache = LLMGenerationCache(cache_dir) if cache_dir else None
         self._prompt_registry: dict[str, str] = self._build_prompt_registry()
+        # Parse each template once up front; generate() validates against these
+        # (fields in template order, so errors name the first one format() would hit)
+        self._prompt_fields: dict[str, tuple[str, ...]] = {
+            prompt_id: tuple(dict.fromkeys(
+                field.partition(".")[0].partition("[")[0]
+                for _, field, _, _ in string.Formatter().parse(template)
+                if field
+            ))
+            for prompt_id, template in self._prompt_registry.items()
+        }
+        # Templates without braces render verbatim and skip formatting entirely
+        self._static_prompts: frozenset[str] = frozenset(
+            prompt_id
+            for prompt_id, template in self._prompt_registry.items()
+            if "{" not in template and "}" not in template
+        )
 
     def _build_prompt_registry(self) -> dict[str, str]:
         """Build registry of approved prompt templates."""
@@ -136,37 +232,108 @@ Be specific and actionable.
         - Use OpenAI API or similar
         - Implement proper RAG retrieval
         - Add logging and audit trails
+
+        When the assistant has a cache_dir, successful results are cached on
+        disk and repeat requests are served without retrieval or LLM calls.
         """
-        # Get prompt template
-        prompt_template = self._prompt_registry.get(request.prompt_template_id, "")
-        if not prompt_template:
-            return LLMGenerationResult(
-                content="[Prompt template not found]",
-                model="none",
-                prompt_id=request.prompt_template_id,
-            )
+        results = await self.generate_batch([request])
+        return results[0]
 
-        # Format prompt with context
-        try:
-            prompt = prompt_template.format(**request.context)
-        except KeyError as e:
-            return LLMGenerationResult(
-                content=f"[Missing context key: {e}]",
-                model="none",
-                prompt_id=request.prompt_template_id,
+    async def generate_batch(
+        self,
+        requests: List[LLMGenerationRequest],
+    ) -> List[LLMGenerationResult]:
+        """
+        Generate content for several requests, retrieving RAG context in one batch.
+
+        Cached and invalid requests are resolved first; the remaining requests
+        share a single knowledge base query and are drafted concurrently.
+        Results are returned in request order.
+        """
+        results: List[Optional[LLMGenerationResult]] = [None] * len(requests)
+        pending: List[int] = []
+        cache_keys = self._cache_keys(requests)
+
+        for i, request in enumerate(requests):
+            if self.cache:
+                cached = self.cache.get(cache_keys[i])
+                if cached is not None:
+                    results[i] = cached
+                    continue
+
+            # Get prompt template
+            if request.prompt_template_id not in self._prompt_registry:
+                results[i] = LLMGenerationResult(
+                    content="[Prompt template not found]",
+                    model="none",
+                    prompt_id=request.prompt_template_id,
+                )
+                continue
+
+            # Validate context covers the prompt's fields
+            missing = next(
+                (
+                    field
+                    for field in self._prompt_fields[request.prompt_template_id]
+                    if field not in request.context
+                ),
+                None,
             )
+            if missing is not None:
+                results[i] = LLMGenerationResult(
+                    content=f"[Missing context key: {missing!r}]",
+                    model="none",
+                    prompt_id=request.prompt_template_id,
+                )
+                continue
+
+            pending.append(i)
+
+        if pending:
+            pending_requests = [requests[i] for i in pending]
+            citations_per_request = self._retrieve_citations(pending_requests)
+            drafts = await asyncio.gather(*(
+                self._draft(request, citations, cache_keys[i])
+                for i, request, citations in zip(pending, pending_requests, citations_per_request)
+            ))
+            for i, draft in zip(pending, drafts):
+                results[i] = draft
+
+        return results
+
+    def _retrieve_citations(self, requests: List[LLMGenerationRequest]) -> List[List[Citation]]:
+        """Retrieve relevant context from the knowledge base (RAG) for each request."""
+        if not self.knowledge_base:
+            return [[] for _ in requests]
+
+        # Only the context keys named in query_keys feed the retrieval query;
+        # the rest of the context is prompt material, not search terms.
+        queries = [
+            " ".join([
+                request.section_type,
+                *(str(request.context[k]) for k in request.query_keys if k in request.context),
+            ])
+            for request in requests
+        ]
+        batch_results = self.knowledge_base.query_batch(queries, n_results=3)
+        return [
+            [self.knowledge_base.create_citation(chunk) for chunk, score in results]
+            for results in batch_results
+        ]
+
+    async def _draft(
+        self,
+        request: LLMGenerationRequest,
+        citations: List[Citation],
+        cache_key: Optional[str] = None,
+    ) -> LLMGenerationResult:
+        """Draft content for a validated request and cache the result."""
+        # Format prompt with context
+        prompt = self._prompt_registry[request.prompt_template_id]
+        if request.prompt_template_id not in self._static_prompts:
+            prompt = prompt.format_map(_PromptContext(request.context))
 
-        # Retrieve relevant context from knowledge base (RAG)
-        citations: List[Citation] = []
-        if self.knowledge_base:
-            # Query knowledge base for relevant chunks
-            query = f"{request.section_type} {' '.join(str(v) for v in request.context.values())}"
-            results = self.knowledge_base.query(query, n_results=3)
-            for chunk, score in results:
-                citation = self.knowledge_base.create_citation(chunk)
-                citations.append(citation)
-
-        # TODO: Call OpenAI API in production
+        # TODO: Call OpenAI API in production with `prompt`
         # For MVP, return a placeholder indicating LLM would be called
         placeholder_content = (
             f"[LLM-assisted draft for {request.section_type}]\n\n"
@@ -177,7 +344,7 @@ Be specific and actionable.
             f"Human review required before publishing."
         )
 
-        return LLMGenerationResult(
+        result = LLMGenerationResult(
             content=placeholder_content,
             citations=citations,
             model="gpt-4-turbo-preview",  # Target model
@@ -185,6 +352,44 @@ Be specific and actionable.
             confidence=0.7,
         )
 
+        if self.cache and cache_key:
+            self.cache.put(cache_key, result)
+
+        return result
+
+    def _cache_keys(self, requests: List[LLMGenerationRequest]) -> List[Optional[str]]:
+        """Cache keys for a batch; the knowledge base state is read once per batch."""
+        if not self.cache:
+            return [None] * len(requests)
+        kb_state = str(self.knowledge_base.chunk_count()) if self.knowledge_base else ""
+        return [
+            self.cache.key_for(
+                request,
+                self._prompt_registry.get(request.prompt_template_id, ""),
+                kb_state,
+            )
+            for request in requests
+        ]
+
+    def resume(
+        self,
+        requests: List[LLMGenerationRequest],
+    ) -> List[Optional[LLMGenerationResult]]:
+        """
+        Look up the cached results of a batch, e.g. after an interrupted run.
+
+        Returns results in request order, with None for requests that still
+        need generating. No retrieval or LLM calls are made; passing the same
+        requests to generate_batch completes only the missing ones.
+        """
+        if not self.cache:
+            return [None] * len(requests)
+        return [self.cache.get(key) for key in self._cache_keys(requests)]
+
+    def clear_cache(self) -> int:
+        """Clear cached generations. Returns the number of entries removed."""
+        return self.cache.clear() if self.cache else 0
+
     def get_available_prompts(self) -> List[str]:
         """List available prompt template IDs."""
         return list(self._prompt_registry.keys())
@@ -2,8 +2,9 @@
 
 from datetime import datetime
 from enum import Enum
+from itertools import chain
 from typing import Optional, List, Dict, Any
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from src.knowledge_base.models import Citation
 from src.market_intel.models import Assumption
@@ -26,6 +27,8 @@ class PlaybookSection(BaseModel):
     Each section has structured content with citations and assumptions.
     """
 
+    model_config = ConfigDict(extra="forbid")
+
     id: str
     title: str
     section_type: str  # e.g., "executive_summary", "icp", "plays", "kpis"
@@ -60,6 +63,8 @@ class Playbook(BaseModel):
     - Export to PPT/PDF
     """
 
+    model_config = ConfigDict(extra="forbid")
+
     id: str
     name: str
     description: str
@@ -91,22 +96,18 @@ class Playbook(BaseModel):
 
     def get_all_citations(self) -> List[Citation]:
         """Get all citations across sections."""
-        citations = []
-        for section in self.sections:
-            citations.extend(section.citations)
-        return citations
+        return list(chain.from_iterable(section.citations for section in self.sections))
 
     def get_all_assumptions(self) -> List[Assumption]:
         """Get all assumptions across sections."""
-        assumptions = []
-        for section in self.sections:
-            assumptions.extend(section.assumptions)
-        return assumptions
+        return list(chain.from_iterable(section.assumptions for section in self.sections))
 
 
 class PlaybookVersion(BaseModel):
     """A versioned snapshot of a playbook."""
 
+    model_config = ConfigDict(extra="forbid")
+
     id: str
     playbook_id: str
     version: str  # e.g., "1.0.0", "1.1.0"
@@ -1,6 +1,13 @@
 """Product Competitiveness and Roadmap module."""
 
-from .models import ProductPortfolio, ProductCompetitiveness, RoadmapRecommendation, ProductRoadmapIntel
+from .models import (
+    ProductPortfolio,
+    ProductCompetitiveness,
+    RoadmapRecommendation,
+    ProductRoadmapIntel,
+    DEFAULT_PRODUCT_PORTFOLIO,
+    DEFAULT_PORTFOLIO_BY_ID,
+)
 from .service import ProductRoadmapService, get_product_roadmap_service
 from .routes import router as product_roadmap_router
 
@@ -9,6 +16,8 @@ __all__ = [
     "ProductCompetitiveness",
     "RoadmapRecommendation",
     "ProductRoadmapIntel",
+    "DEFAULT_PRODUCT_PORTFOLIO",
+    "DEFAULT_PORTFOLIO_BY_ID",
     "ProductRoadmapService",
     "get_product_roadmap_service",
     "product_roadmap_router",
@@ -1,9 +1,12 @@
 """Models for Product Competitiveness and Roadmap Recommendations."""
 
 from datetime import datetime
-from typing import List, Optional
-from pydantic import BaseModel, Field
+from itertools import count
+from types import MappingProxyType
+from typing import List, Mapping, Optional, Tuple
+from pydantic import BaseModel, ConfigDict, Field
 from enum import Enum
+import time
 
 
 class MarketPosition(str, Enum):
@@ -37,6 +40,8 @@ class ProductCategory(str, Enum):
 
 class ProductPortfolio(BaseModel):
     """Comcast Business product in the portfolio."""
+    model_config = ConfigDict(frozen=True)
+
     id: str
     name: str
     category: ProductCategory
@@ -64,6 +69,8 @@ class ProductPortfolio(BaseModel):
 
 class CompetitorProduct(BaseModel):
     """Competitor's product for comparison."""
+    model_config = ConfigDict(frozen=True)
+
     competitor: str
     product_name: str
     strengths: List[str] = Field(default_factory=list)
@@ -72,6 +79,8 @@ class CompetitorProduct(BaseModel):
 
 class ProductCompetitiveness(BaseModel):
     """Competitive analysis for a product category."""
+    model_config = ConfigDict(frozen=True)
+
     category: ProductCategory
     category_label: str
     
@@ -129,9 +138,17 @@ class RoadmapRecommendation(BaseModel):
     success_metrics: List[str] = Field(default_factory=list)
 
 
+_intel_counter = count()
+
+
+def _new_intel_id() -> str:
+    """Generate a unique intel id (nanosecond timestamp plus a process-local counter)."""
+    return f"prod_intel_{time.time_ns()}_{next(_intel_counter)}"
+
+
 class ProductRoadmapIntel(BaseModel):
     """LLM-generated product competitiveness and roadmap intelligence."""
-    id: str = Field(default_factory=lambda: f"prod_intel_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}")
+    id: str = Field(default_factory=_new_intel_id)
     generated_at: datetime = Field(default_factory=datetime.utcnow)
     llm_provider: str = ""
     llm_model: str = ""
@@ -171,9 +188,19 @@ class ProductRoadmapIntel(BaseModel):
     methodology_notes: str = ""
 
 
+def _construct_portfolio(**fields) -> ProductPortfolio:
+    """
+    Build a ProductPortfolio from trusted literal data without validation.
+
+    Only for the hand-written defaults below: enum fields must already be
+    enum members. Omitted fields still receive their declared defaults.
+    """
+    return ProductPortfolio.model_construct(**fields)
+
+
 # Default product portfolio for Comcast Business
-DEFAULT_PRODUCT_PORTFOLIO = [
-    ProductPortfolio(
+DEFAULT_PRODUCT_PORTFOLIO: Tuple[ProductPortfolio, ...] = (
+    _construct_portfolio(
         id="broadband",
         name="Business Internet (Coax/Fiber)",
         category=ProductCategory.CONNECTIVITY,
@@ -187,7 +214,7 @@ DEFAULT_PRODUCT_PORTFOLIO = [
         competitive_gaps=["Limited fiber-to-the-prem in some areas", "Speed tier perception"],
         maturity="mature",
     ),
-    ProductPortfolio(
+    _construct_portfolio(
         id="ethernet",
         name="Ethernet Dedicated Internet",
         category=ProductCategory.CONNECTIVITY,
@@ -201,7 +228,7 @@ DEFAULT_PRODUCT_PORTFOLIO = [
         competitive_gaps=["Geographic coverage vs. Lumen", "Large enterprise presence"],
         maturity="mature",
     ),
-    ProductPortfolio(
+    _construct_portfolio(
         id="fixed_wireless",
         name="Fixed Wireless Access",
         category=ProductCategory.CONNECTIVITY,
@@ -215,7 +242,7 @@ DEFAULT_PRODUCT_PORTFOLIO = [
         competitive_gaps=["Coverage footprint", "Speed consistency", "Enterprise perception"],
         maturity="emerging",
     ),
-    ProductPortfolio(
+    _construct_portfolio(
         id="mobile_enterprise",
         name="Mobile Enterprise",
         category=ProductCategory.MOBILE,
@@ -231,7 +258,7 @@ DEFAULT_PRODUCT_PORTFOLIO = [
         competitive_gaps=["No current offering", "Late to market", "Network coverage"],
         maturity="emerging",
     ),
-    ProductPortfolio(
+    _construct_portfolio(
         id="sdwan",
         name="SD-WAN",
         category=ProductCategory.SECURE_NETWORKING,
@@ -245,7 +272,7 @@ DEFAULT_PRODUCT_PORTFOLIO = [
         competitive_gaps=["Feature depth vs. pure-play", "Multi-vendor support", "Global reach"],
         maturity="growing",
     ),
-    ProductPortfolio(
+    _construct_portfolio(
         id="sase",
         name="SASE / Secure Access Service Edge",
         category=ProductCategory.SECURE_NETWORKING,
@@ -259,7 +286,7 @@ DEFAULT_PRODUCT_PORTFOLIO = [
         competitive_gaps=["Feature maturity", "Brand recognition in security", "Partner ecosystem"],
         maturity="emerging",
     ),
-    ProductPortfolio(
+    _construct_portfolio(
         id="managed_firewall",
         name="Managed Firewall",
         category=ProductCategory.SECURE_NETWORKING,
@@ -273,7 +300,7 @@ DEFAULT_PRODUCT_PORTFOLIO = [
         competitive_gaps=["Advanced threat capabilities", "SOAR integration"],
         maturity="mature",
     ),
-    ProductPortfolio(
+    _construct_portfolio(
         id="security_edge",
         name="SecurityEdge",
         category=ProductCategory.CYBERSECURITY,
@@ -287,7 +314,7 @@ DEFAULT_PRODUCT_PORTFOLIO = [
         competitive_gaps=["Enterprise feature depth", "Advanced analytics"],
         maturity="mature",
     ),
-    ProductPortfolio(
+    _construct_portfolio(
         id="advanced_security",
         name="Advanced Threat Protection / DDoS / MDR",
         category=ProductCategory.CYBERSECURITY,
@@ -301,7 +328,7 @@ DEFAULT_PRODUCT_PORTFOLIO = [
         competitive_gaps=["Brand in security", "Feature depth", "Threat intel"],
         maturity="growing",
     ),
-    ProductPortfolio(
+    _construct_portfolio(
         id="ucaas",
         name="UCaaS / Business VoiceEdge",
         category=ProductCategory.VOICE_COLLAB,
@@ -315,7 +342,7 @@ DEFAULT_PRODUCT_PORTFOLIO = [
         competitive_gaps=["AI features", "Collaboration tools", "Video quality"],
         maturity="mature",
     ),
-    ProductPortfolio(
+    _construct_portfolio(
         id="ccaas",
         name="CCaaS / Contact Center",
         category=ProductCategory.VOICE_COLLAB,
@@ -329,7 +356,7 @@ DEFAULT_PRODUCT_PORTFOLIO = [
         competitive_gaps=["AI/ML capabilities", "WFM features", "Integrations"],
         maturity="growing",
     ),
-    ProductPortfolio(
+    _construct_portfolio(
         id="sip_trunking",
         name="SIP Trunking",
         category=ProductCategory.VOICE_COLLAB,
@@ -343,7 +370,7 @@ DEFAULT_PRODUCT_PORTFOLIO = [
         competitive_gaps=["Programmable features", "API ecosystem"],
         maturity="mature",
     ),
-    ProductPortfolio(
+    _construct_portfolio(
         id="colocation",
         name="Data Center / Colocation",
         category=ProductCategory.DATA_CENTER,
@@ -357,5 +384,9 @@ DEFAULT_PRODUCT_PORTFOLIO = [
         competitive_gaps=["Footprint", "Scale", "Global presence"],
         maturity="growing",
     ),
-]
+)
 
+# Read-only id lookup over the default portfolio
+DEFAULT_PORTFOLIO_BY_ID: Mapping[str, ProductPortfolio] = MappingProxyType(
+    {p.id: p for p in DEFAULT_PRODUCT_PORTFOLIO}
+)
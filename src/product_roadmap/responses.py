@@ -0,0 +1,20 @@
+"""Response classes for Product Roadmap routes."""
+
+from typing import Any
+
+import pydantic_core
+from fastapi.responses import JSONResponse
+
+
+class PydanticJSONResponse(JSONResponse):
+    """
+    JSON response rendered directly by pydantic-core.
+
+    Content may mix plain dicts/lists with pydantic models, enums and
+    datetimes; everything is serialized in a single Rust pass. Returning
+    this from a route skips FastAPI's jsonable_encoder and response_model
+    revalidation (response_model is still used for OpenAPI docs).
+    """
+
+    def render(self, content: Any) -> bytes:
+        return pydantic_core.to_json(content)
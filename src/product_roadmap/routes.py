@@ -1,7 +1,8 @@
 """API routes for Product Competitiveness and Roadmap analysis."""
 
+from collections import defaultdict
 from typing import List, Optional
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Request, Response
 from pydantic import BaseModel
 from datetime import datetime
 
@@ -12,6 +13,7 @@ from .models import (
     ProductRoadmapIntel,
     ProductCategory,
 )
+from .responses import PydanticJSONResponse
 from .service import get_product_roadmap_service
 from ..jobs.queue import get_job_queue
 from ..jobs.models import JobType
@@ -26,12 +28,12 @@ def _run_product_intel_generation(job_id: str, force: bool):
     service = get_product_roadmap_service()
     
     try:
-        queue.update_progress(job_id, 20, "Gathering product portfolio data...")
-        
         queue.update_progress(job_id, 50, "Calling LLM for competitive analysis...")
-        intel = service.generate_intel(force_refresh=force)
+        intel = service.generate_intel(
+            force_refresh=force,
+            on_progress=lambda pct, message: queue.update_progress(job_id, pct, message),
+        )
         
-        queue.update_progress(job_id, 90, "Finalizing roadmap recommendations...")
         queue.complete_job(job_id, {
             "portfolio_health_score": intel.portfolio_health_score if intel else 0,
             "recommendations_count": len(intel.roadmap_recommendations) if intel else 0,
@@ -41,6 +43,34 @@ def _run_product_intel_generation(job_id: str, force: bool):
         queue.fail_job(job_id, str(e))
 
 
+def _etag_headers(etag: Optional[str]) -> dict:
+    """Caching headers for a response derived from the current intel."""
+    if etag is None:
+        return {}
+    return {"ETag": etag, "Cache-Control": "private, must-revalidate"}
+
+
+def _not_modified(request: Request, etag: Optional[str]) -> Optional[Response]:
+    """Return a 304 response if the client already holds the current intel."""
+    if etag is None:
+        return None
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return None
+    # If-None-Match uses weak comparison: W/"x" matches "x"
+    opaque = _strip_weak(etag)
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        if tag == "*" or _strip_weak(tag) == opaque:
+            return Response(status_code=304, headers=_etag_headers(etag))
+    return None
+
+
+def _strip_weak(tag: str) -> str:
+    """Return an entity tag without its weak indicator."""
+    return tag[2:] if tag.startswith("W/") else tag
+
+
 # ═══════════════════════════════════════════════════════════════════════════
 # RESPONSE MODELS
 # ═══════════════════════════════════════════════════════════════════════════
@@ -75,48 +105,32 @@ class IntelResponse(BaseModel):
 async def get_portfolio():
     """Get the Comcast Business product portfolio."""
     service = get_product_roadmap_service()
-    portfolio = service.get_default_portfolio()
-    
-    categories = list(set(p.category.value for p in portfolio))
-    
-    return PortfolioResponse(
-        products=[p.model_dump() for p in portfolio],
-        total_products=len(portfolio),
-        categories=categories,
-    )
+    return Response(content=service.get_portfolio_json(), media_type="application/json")
 
 
 @router.get("/portfolio/{product_id}")
 async def get_product(product_id: str):
     """Get a specific product from the portfolio."""
     service = get_product_roadmap_service()
-    portfolio = service.get_default_portfolio()
+    product = service.get_product(product_id)
     
-    for product in portfolio:
-        if product.id == product_id:
-            return product.model_dump()
+    if product is None:
+        raise HTTPException(status_code=404, detail=f"Product {product_id} not found")
     
-    raise HTTPException(status_code=404, detail=f"Product {product_id} not found")
+    return PydanticJSONResponse(product)
 
 
 @router.get("/portfolio/category/{category}")
 async def get_products_by_category(category: str):
     """Get products in a specific category."""
     service = get_product_roadmap_service()
-    portfolio = service.get_default_portfolio()
     
     try:
         cat = ProductCategory(category)
     except ValueError:
         raise HTTPException(status_code=400, detail=f"Invalid category: {category}")
     
-    products = [p.model_dump() for p in portfolio if p.category == cat]
-    
-    return {
-        "category": category,
-        "products": products,
-        "count": len(products),
-    }
+    return Response(content=service.get_category_json(cat), media_type="application/json")
 
 
 # ═══════════════════════════════════════════════════════════════════════════
@@ -130,32 +144,39 @@ async def get_intel_status():
     intel = service.get_intel()
     
     if intel:
-        return IntelStatusResponse(
+        return PydanticJSONResponse(IntelStatusResponse.model_construct(
             has_intel=True,
             generated_at=intel.generated_at,
             llm_provider=intel.llm_provider,
             llm_model=intel.llm_model,
-        )
+        ))
     
-    return IntelStatusResponse(has_intel=False)
+    return PydanticJSONResponse(IntelStatusResponse.model_construct(has_intel=False))
 
 
 @router.get("/intel", response_model=IntelResponse)
-async def get_intel():
+async def get_intel(request: Request):
     """Get the current product roadmap intel."""
     service = get_product_roadmap_service()
     intel = service.get_intel()
+    etag = service.get_intel_etag(intel)
+    
+    not_modified = _not_modified(request, etag)
+    if not_modified:
+        return not_modified
     
     if not intel:
-        return IntelResponse(
-            status="not_generated",
-            message="Product roadmap intel has not been generated yet. Use POST /intel/generate to create it.",
-        )
+        return PydanticJSONResponse({
+            "status": "not_generated",
+            "intel": None,
+            "message": "Product roadmap intel has not been generated yet. Use POST /intel/generate to create it.",
+        })
     
-    return IntelResponse(
-        status="generated",
-        intel=intel.model_dump(),
-    )
+    return PydanticJSONResponse({
+        "status": "generated",
+        "intel": intel,
+        "message": None,
+    }, headers=_etag_headers(etag))
 
 
 @router.post("/intel/generate")
@@ -215,45 +236,18 @@ async def delete_intel():
 # ═══════════════════════════════════════════════════════════════════════════
 
 @router.get("/summary")
-async def get_summary():
+async def get_summary(request: Request):
     """Get a summary of the product portfolio and intel status."""
     service = get_product_roadmap_service()
-    portfolio = service.get_default_portfolio()
     intel = service.get_intel()
+    etag = service.get_intel_etag(intel)
     
-    # Calculate portfolio stats
-    total_penetration = sum(p.current_penetration_pct for p in portfolio if p.is_launched)
-    launched_count = sum(1 for p in portfolio if p.is_launched)
-    avg_penetration = total_penetration / launched_count if launched_count > 0 else 0
-    
-    avg_growth = sum(p.yoy_growth_pct for p in portfolio if p.is_launched) / launched_count if launched_count > 0 else 0
-    
-    # Category breakdown
-    category_counts = {}
-    for p in portfolio:
-        cat = p.category.value
-        if cat not in category_counts:
-            category_counts[cat] = 0
-        category_counts[cat] += 1
-    
-    # Position breakdown
-    position_counts = {}
-    for p in portfolio:
-        pos = p.market_position.value
-        if pos not in position_counts:
-            position_counts[pos] = 0
-        position_counts[pos] += 1
+    not_modified = _not_modified(request, etag)
+    if not_modified:
+        return not_modified
     
     summary = {
-        "portfolio": {
-            "total_products": len(portfolio),
-            "launched_products": launched_count,
-            "upcoming_products": len(portfolio) - launched_count,
-            "avg_penetration_pct": round(avg_penetration, 1),
-            "avg_yoy_growth_pct": round(avg_growth, 1),
-            "categories": category_counts,
-            "positions": position_counts,
-        },
+        "portfolio": service.get_portfolio_stats(),
         "intel": {
             "has_intel": intel is not None,
         },
@@ -271,14 +265,19 @@ async def get_summary():
             "expected_roi_pct": intel.expected_roi_pct,
         })
     
-    return summary
+    return PydanticJSONResponse(summary, headers=_etag_headers(etag))
 
 
 @router.get("/recommendations")
-async def get_recommendations():
+async def get_recommendations(request: Request):
     """Get just the roadmap recommendations from intel."""
     service = get_product_roadmap_service()
     intel = service.get_intel()
+    etag = service.get_intel_etag(intel)
+    
+    not_modified = _not_modified(request, etag)
+    if not_modified:
+        return not_modified
     
     if not intel:
         return {
@@ -287,37 +286,34 @@ async def get_recommendations():
             "message": "Generate intel first to see recommendations.",
         }
     
-    # Group by phase
-    by_phase = {}
-    for rec in intel.roadmap_recommendations:
-        phase = rec.phase
-        if phase not in by_phase:
-            by_phase[phase] = []
-        by_phase[phase].append(rec.model_dump())
-    
-    # Group by priority
-    by_priority = {}
+    # Group by phase and priority in one pass; the response serializes the
+    # models directly, so no intermediate model_dump() dicts are built
+    by_phase = defaultdict(list)
+    by_priority = defaultdict(list)
     for rec in intel.roadmap_recommendations:
-        priority = rec.priority.value
-        if priority not in by_priority:
-            by_priority[priority] = []
-        by_priority[priority].append(rec.model_dump())
+        by_phase[rec.phase].append(rec)
+        by_priority[rec.priority.value].append(rec)
     
-    return {
+    return PydanticJSONResponse({
         "status": "generated",
         "total_recommendations": len(intel.roadmap_recommendations),
         "by_phase": by_phase,
         "by_priority": by_priority,
         "total_investment_millions": intel.total_recommended_investment_millions,
         "expected_revenue_millions": intel.expected_revenue_impact_millions,
-    }
+    }, headers=_etag_headers(etag))
 
 
 @router.get("/competitive-analysis")
-async def get_competitive_analysis():
+async def get_competitive_analysis(request: Request):
     """Get just the competitive analysis from intel."""
     service = get_product_roadmap_service()
     intel = service.get_intel()
+    etag = service.get_intel_etag(intel)
+    
+    not_modified = _not_modified(request, etag)
+    if not_modified:
+        return not_modified
     
     if not intel:
         return {
@@ -326,9 +322,9 @@ async def get_competitive_analysis():
             "message": "Generate intel first to see competitive analysis.",
         }
     
-    return {
+    return PydanticJSONResponse({
         "status": "generated",
-        "analysis": [ca.model_dump() for ca in intel.competitive_analysis],
+        "analysis": intel.competitive_analysis,
         "total_categories": len(intel.competitive_analysis),
-    }
+    }, headers=_etag_headers(etag))
 
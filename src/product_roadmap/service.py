@@ -1,12 +1,18 @@
 """Service for LLM-driven product competitiveness and roadmap analysis."""
 
+import atexit
+import hashlib
 import json
+import logging
 import os
 import re
+from collections import Counter
 from datetime import datetime
-from typing import Optional
+from typing import Callable, Optional
 from pathlib import Path
 
+import pydantic_core
+
 from .models import (
     ProductPortfolio,
     ProductCompetitiveness,
@@ -17,31 +23,74 @@ from .models import (
     InvestmentPriority,
     CompetitorProduct,
     DEFAULT_PRODUCT_PORTFOLIO,
+    DEFAULT_PORTFOLIO_BY_ID,
 )
 
 
-class ProductRoadmapService:
-    """Service to generate product competitiveness and roadmap analysis using LLM."""
+logger = logging.getLogger(__name__)
+
+# Fenced ```json { ... } ``` block in an LLM response
+_JSON_BLOCK_RE = re.compile(r'```(?:json)?\s*(\{.*?\})\s*```', re.DOTALL)
+
+# Typical size of a full intel response, used to estimate streaming progress
+_EXPECTED_RESPONSE_CHARS = 40_000
+
+
+def _stream_progress(on_progress: Callable[[int, str], None]) -> Callable[[int], None]:
+    """Map streamed character counts onto 50-80% job progress, reporting each 10% step once."""
+    last_pct = 50
     
-    _instance: Optional["ProductRoadmapService"] = None
+    def on_chunk(received: int) -> None:
+        nonlocal last_pct
+        pct = 50 + min(30, received * 30 // _EXPECTED_RESPONSE_CHARS) // 10 * 10
+        if pct > last_pct:
+            last_pct = pct
+            on_progress(pct, "Receiving competitive analysis from LLM...")
     
-    def __new__(cls):
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-            cls._instance._initialized = False
-        return cls._instance
+    return on_chunk
+
+
+class ProductRoadmapService:
+    """Service to generate product competitiveness and roadmap analysis using LLM."""
     
     def __init__(self):
-        if self._initialized:
-            return
-        
-        self._initialized = True
-        
-        from src.db_utils import db_load, db_save
+        from src.db_utils import db_load, db_save, db_delete
         self._db_load = db_load
         self._db_save = db_save
+        self._db_delete = db_delete
         
         self._intel: Optional[ProductRoadmapIntel] = self._load_intel()
+        
+        # One pooled client per LLM provider so repeat calls reuse connections
+        self._http_clients: dict = {}
+        
+        # The default portfolio is static; derive its views once
+        self._portfolio_categories: list[str] = sorted(
+            {p.category.value for p in DEFAULT_PRODUCT_PORTFOLIO}
+        )
+        self._portfolio_by_category: dict[ProductCategory, tuple[ProductPortfolio, ...]] = {
+            category: tuple(p for p in DEFAULT_PRODUCT_PORTFOLIO if p.category == category)
+            for category in ProductCategory
+        }
+        self._portfolio_stats: dict = self._compute_portfolio_stats()
+        # Pre-serialized response bodies for the static portfolio endpoints
+        self._portfolio_json: bytes = pydantic_core.to_json({
+            "products": DEFAULT_PRODUCT_PORTFOLIO,
+            "total_products": len(DEFAULT_PRODUCT_PORTFOLIO),
+            "categories": self._portfolio_categories,
+        })
+        self._category_json: dict[ProductCategory, bytes] = {
+            category: pydantic_core.to_json({
+                "category": category.value,
+                "products": products,
+                "count": len(products),
+            })
+            for category, products in self._portfolio_by_category.items()
+        }
+        # Rendered once so the LLM prompt prefix is byte-identical across calls
+        self._portfolio_summary: str = "\n".join(
+            self._render_product_line(p) for p in DEFAULT_PRODUCT_PORTFOLIO
+        )
     
     def _load_intel(self) -> Optional[ProductRoadmapIntel]:
         """Load cached intel from database."""
@@ -50,7 +99,7 @@ class ProductRoadmapService:
             try:
                 return ProductRoadmapIntel(**data)
             except Exception as e:
-                print(f"Error loading product roadmap intel: {e}")
+                logger.warning("Error loading product roadmap intel: %s", e)
         return None
     
     def _save_intel(self, intel: ProductRoadmapIntel) -> None:
@@ -59,16 +108,96 @@ class ProductRoadmapService:
             self._db_save("product_roadmap_intel", intel.model_dump(mode="json"))
             self._intel = intel
         except Exception as e:
-            print(f"Error saving product roadmap intel: {e}")
+            logger.warning("Error saving product roadmap intel: %s", e)
     
     def get_intel(self) -> Optional[ProductRoadmapIntel]:
         """Get the current product roadmap intel."""
         return self._intel
     
-    def get_default_portfolio(self) -> list[ProductPortfolio]:
+    def get_intel_etag(self, intel: Optional[ProductRoadmapIntel]) -> Optional[str]:
+        """
+        Get an HTTP entity tag identifying the given intel, if any.
+
+        Takes the intel instance a response is built from, so the tag always
+        matches the body even if the cached intel is replaced concurrently.
+        """
+        if not intel:
+            return None
+        version = f"{intel.id}:{intel.generated_at.isoformat()}"
+        return f'"{hashlib.blake2b(version.encode(), digest_size=8).hexdigest()}"'
+    
+    def get_default_portfolio(self) -> tuple[ProductPortfolio, ...]:
         """Get the default product portfolio."""
         return DEFAULT_PRODUCT_PORTFOLIO
     
+    def get_product(self, product_id: str) -> Optional[ProductPortfolio]:
+        """Get a default portfolio product by id."""
+        return DEFAULT_PORTFOLIO_BY_ID.get(product_id)
+    
+    def get_portfolio_categories(self) -> list[str]:
+        """Get the category values present in the default portfolio."""
+        return self._portfolio_categories
+    
+    def get_products_by_category(self, category: ProductCategory) -> tuple[ProductPortfolio, ...]:
+        """Get default portfolio products in a category."""
+        return self._portfolio_by_category[category]
+    
+    def get_portfolio_json(self) -> bytes:
+        """Get the serialized default portfolio response body."""
+        return self._portfolio_json
+    
+    def get_category_json(self, category: ProductCategory) -> bytes:
+        """Get the serialized response body for a portfolio category."""
+        return self._category_json[category]
+    
+    def get_portfolio_stats(self) -> dict:
+        """Get precomputed summary statistics for the default portfolio."""
+        return self._portfolio_stats
+    
+    def _compute_portfolio_stats(self) -> dict:
+        """Compute summary statistics for the default portfolio."""
+        portfolio = DEFAULT_PRODUCT_PORTFOLIO
+        
+        # Single pass: launched totals plus category and position breakdowns
+        launched_count = 0
+        total_penetration = 0.0
+        total_growth = 0.0
+        category_counts: Counter = Counter()
+        position_counts: Counter = Counter()
+        for p in portfolio:
+            if p.is_launched:
+                launched_count += 1
+                total_penetration += p.current_penetration_pct
+                total_growth += p.yoy_growth_pct
+            category_counts[p.category.value] += 1
+            position_counts[p.market_position.value] += 1
+        
+        avg_penetration = total_penetration / launched_count if launched_count > 0 else 0
+        avg_growth = total_growth / launched_count if launched_count > 0 else 0
+        
+        return {
+            "total_products": len(portfolio),
+            "launched_products": launched_count,
+            "upcoming_products": len(portfolio) - launched_count,
+            "avg_penetration_pct": round(avg_penetration, 1),
+            "avg_yoy_growth_pct": round(avg_growth, 1),
+            "categories": dict(category_counts),
+            "positions": dict(position_counts),
+        }
+    
+    @staticmethod
+    def _render_product_line(prod: ProductPortfolio) -> str:
+        """Render one product's entry in the LLM portfolio summary."""
+        return f"""
+- **{prod.name}** ({prod.category.value})
+  - Penetration: {prod.current_penetration_pct}% | YoY Growth: {prod.yoy_growth_pct}%
+  - Market Position: {prod.market_position.value} (Rank #{prod.market_rank})
+  - Competitors: {', '.join(prod.key_competitors[:3])}
+  - Strengths: {', '.join(prod.competitive_strengths[:2])}
+  - Gaps: {', '.join(prod.competitive_gaps[:2])}
+  - Status: {'Launched' if prod.is_launched else f'Planned {prod.launch_date}'}
+"""
+    
     def _get_llm_client(self):
         """Get the configured LLM client."""
         from src.admin.store import AdminConfigStore
@@ -81,118 +210,193 @@ class ProductRoadmapService:
         
         raise ValueError("No LLM provider configured. Please set up an LLM provider in Admin Setup.")
     
-    def _call_llm(self, prompt: str, system_prompt: str) -> tuple[str, str, str]:
-        """Call the configured LLM and return response, provider, model."""
+    def _get_http_client(self, provider: str):
+        """Get the pooled HTTP client for an LLM provider, creating it on first use."""
+        client = self._http_clients.get(provider)
+        if client is None:
+            import httpx
+            
+            client = httpx.Client(
+                timeout=600.0,
+                limits=httpx.Limits(max_keepalive_connections=8, max_connections=16),
+            )
+            self._http_clients[provider] = client
+        return client
+    
+    def close(self) -> None:
+        """Close pooled HTTP clients."""
+        for client in self._http_clients.values():
+            client.close()
+        self._http_clients.clear()
+    
+    def _stream_llm_text(
+        self,
+        provider: str,
+        url: str,
+        headers: dict,
+        payload: dict,
+        on_chunk: Optional[Callable[[int], None]] = None,
+    ) -> tuple[str, Optional[str]]:
+        """
+        POST a streaming completion request and accumulate the text deltas.
+        
+        Handles OpenAI-style (choices[0].delta) and Anthropic-style
+        (content_block_delta / message_delta) server-sent events. Calls
+        `on_chunk` with the number of characters received so far. Returns
+        the full text and the provider's stop reason, if reported.
+        """
+        client = self._get_http_client(provider)
+        parts: list[str] = []
+        received = 0
+        stop_reason: Optional[str] = None
+        
+        with client.stream("POST", url, headers=headers, json={**payload, "stream": True}) as response:
+            if response.status_code != 200:
+                response.read()
+                logger.warning("%s API error %s: %s", provider, response.status_code, response.text[:500])
+            response.raise_for_status()
+            
+            for line in response.iter_lines():
+                if not line.startswith("data:"):
+                    continue
+                data = line[5:].strip()
+                if data == "[DONE]":
+                    break
+                event = json.loads(data)
+                
+                text = ""
+                if "choices" in event:
+                    if event["choices"]:
+                        choice = event["choices"][0]
+                        text = (choice.get("delta") or {}).get("content") or ""
+                        stop_reason = choice.get("finish_reason") or stop_reason
+                elif event.get("type") == "content_block_delta":
+                    text = event["delta"].get("text", "")
+                elif event.get("type") == "message_delta":
+                    stop_reason = event["delta"].get("stop_reason") or stop_reason
+                elif event.get("type") == "error":
+                    raise ValueError(f"{provider} stream error: {event.get('error')}")
+                
+                if text:
+                    parts.append(text)
+                    received += len(text)
+                    if on_chunk:
+                        on_chunk(received)
+        
+        return "".join(parts), stop_reason
+    
+    def _call_llm(
+        self,
+        prompt: str,
+        system_prompt: str,
+        on_chunk: Optional[Callable[[int], None]] = None,
+    ) -> tuple[str, str, str]:
+        """Call the configured LLM (streaming) and return response, provider, model."""
         provider_config = self._get_llm_client()
+        provider = provider_config.provider.value
         
         if provider_config.provider == "xai":
-            import httpx
-            
             model = provider_config.get_default_model() or "grok-4-1-fast-reasoning"
             
-            with httpx.Client(timeout=600.0) as client:
-                response = client.post(
-                    "https://api.x.ai/v1/chat/completions",
-                    headers={
-                        "Authorization": f"Bearer {provider_config.api_key}",
-                        "Content-Type": "application/json",
-                    },
-                    json={
-                        "model": model,
-                        "messages": [
-                            {"role": "system", "content": system_prompt},
-                            {"role": "user", "content": prompt},
-                        ],
-                        "max_tokens": 25000,
-                        "temperature": 0.7,
-                    },
-                )
-                response.raise_for_status()
-                data = response.json()
-                return data["choices"][0]["message"]["content"], provider_config.provider.value, model
+            content_text, _ = self._stream_llm_text(
+                provider,
+                "https://api.x.ai/v1/chat/completions",
+                headers={
+                    "Authorization": f"Bearer {provider_config.api_key}",
+                    "Content-Type": "application/json",
+                },
+                payload={
+                    "model": model,
+                    "messages": [
+                        {"role": "system", "content": system_prompt},
+                        {"role": "user", "content": prompt},
+                    ],
+                    "max_tokens": 25000,
+                    "temperature": 0.7,
+                },
+                on_chunk=on_chunk,
+            )
+            return content_text, provider, model
         
         elif provider_config.provider == "openai":
-            import httpx
-            
             model = provider_config.get_default_model() or "gpt-4o"
             
-            with httpx.Client(timeout=600.0) as client:
-                response = client.post(
-                    "https://api.openai.com/v1/chat/completions",
-                    headers={
-                        "Authorization": f"Bearer {provider_config.api_key}",
-                        "Content-Type": "application/json",
-                    },
-                    json={
-                        "model": model,
-                        "messages": [
-                            {"role": "system", "content": system_prompt},
-                            {"role": "user", "content": prompt},
-                        ],
-                        "max_tokens": 25000,
-                        "temperature": 0.7,
-                    },
-                )
-                response.raise_for_status()
-                data = response.json()
-                return data["choices"][0]["message"]["content"], provider_config.provider.value, model
+            content_text, _ = self._stream_llm_text(
+                provider,
+                "https://api.openai.com/v1/chat/completions",
+                headers={
+                    "Authorization": f"Bearer {provider_config.api_key}",
+                    "Content-Type": "application/json",
+                },
+                payload={
+                    "model": model,
+                    "messages": [
+                        {"role": "system", "content": system_prompt},
+                        {"role": "user", "content": prompt},
+                    ],
+                    "max_tokens": 25000,
+                    "temperature": 0.7,
+                },
+                on_chunk=on_chunk,
+            )
+            return content_text, provider, model
         
         elif provider_config.provider == "anthropic":
-            import httpx
-            
             model = provider_config.get_default_model()
             
-            with httpx.Client(timeout=600.0) as client:
-                response = client.post(
-                    "https://api.anthropic.com/v1/messages",
-                    headers={
-                        "x-api-key": provider_config.api_key,
-                        "Content-Type": "application/json",
-                        "anthropic-version": "2023-06-01",
-                    },
-                    json={
-                        "model": model,
-                        "max_tokens": 25000,
-                        "system": system_prompt,
-                        "messages": [
-                            {"role": "user", "content": prompt},
-                        ],
-                    },
-                )
-                if response.status_code != 200:
-                    print(f"Anthropic API error {response.status_code}: {response.text[:500]}")
-                response.raise_for_status()
-                data = response.json()
-                stop_reason = data.get("stop_reason", "unknown")
-                content_text = data["content"][0]["text"]
-                print(f"Anthropic product roadmap response: {len(content_text)} chars, stop_reason={stop_reason}")
-                if stop_reason == "max_tokens":
-                    print("WARNING: Product roadmap response was truncated due to max_tokens limit")
-                return content_text, provider_config.provider.value, model
+            content_text, stop_reason = self._stream_llm_text(
+                provider,
+                "https://api.anthropic.com/v1/messages",
+                headers={
+                    "x-api-key": provider_config.api_key,
+                    "Content-Type": "application/json",
+                    "anthropic-version": "2023-06-01",
+                },
+                payload={
+                    "model": model,
+                    "max_tokens": 25000,
+                    "system": system_prompt,
+                    "messages": [
+                        {
+                            "role": "user",
+                            "content": [
+                                # System + user prompt are static for a given portfolio;
+                                # mark them as a cacheable prefix for repeat generations.
+                                {"type": "text", "text": prompt, "cache_control": {"type": "ephemeral"}},
+                            ],
+                        },
+                    ],
+                },
+                on_chunk=on_chunk,
+            )
+            logger.info(
+                "Anthropic product roadmap response: %d chars, stop_reason=%s",
+                len(content_text),
+                stop_reason or "unknown",
+            )
+            if stop_reason == "max_tokens":
+                logger.warning("Product roadmap response was truncated due to max_tokens limit")
+            return content_text, provider, model
         
         else:
             raise ValueError(f"Unsupported LLM provider: {provider_config.provider}")
     
-    def generate_intel(self, force_refresh: bool = False) -> ProductRoadmapIntel:
-        """Generate comprehensive product competitiveness and roadmap analysis."""
+    def generate_intel(
+        self,
+        force_refresh: bool = False,
+        on_progress: Optional[Callable[[int, str], None]] = None,
+    ) -> ProductRoadmapIntel:
+        """
+        Generate comprehensive product competitiveness and roadmap analysis.
+        
+        `on_progress(pct, message)` is called as the LLM response streams in,
+        in 10% steps between 50% and 80%.
+        """
         
         # Check if we have cached intel and force_refresh is False
         if self._intel and not force_refresh:
             return self._intel
         
-        # Build portfolio summary for prompt
-        portfolio_summary = []
-        for prod in DEFAULT_PRODUCT_PORTFOLIO:
-            portfolio_summary.append(f"""
-- **{prod.name}** ({prod.category.value})
-  - Penetration: {prod.current_penetration_pct}% | YoY Growth: {prod.yoy_growth_pct}%
-  - Market Position: {prod.market_position.value} (Rank #{prod.market_rank})
-  - Competitors: {', '.join(prod.key_competitors[:3])}
-  - Strengths: {', '.join(prod.competitive_strengths[:2])}
-  - Gaps: {', '.join(prod.competitive_gaps[:2])}
-  - Status: {'Launched' if prod.is_launched else f'Planned {prod.launch_date}'}
-""")
-        
         system_prompt = """You are a senior strategy consultant specializing in B2B telecommunications, 
 enterprise networking, and cybersecurity markets. You provide BCG/McKinsey-quality strategic analysis 
 with specific, actionable recommendations backed by market data.
@@ -213,7 +417,7 @@ Be specific with numbers, competitors, and market data. Avoid generic recommenda
 Generate a comprehensive Product Competitiveness and Roadmap Analysis for Comcast Business Enterprise.
 
 ## Current Portfolio Assessment:
-{chr(10).join(portfolio_summary)}
+{self._portfolio_summary}
 
 ## Market Context (2025-2028):
 - Enterprise networking market: $85B TAM, 8% CAGR
@@ -320,7 +524,8 @@ Be specific and actionable. This will be used by senior executives to make inves
 """
 
         # Call LLM
-        response_text, provider, model = self._call_llm(user_prompt, system_prompt)
+        on_chunk = _stream_progress(on_progress) if on_progress else None
+        response_text, provider, model = self._call_llm(user_prompt, system_prompt, on_chunk)
         
         # Parse JSON from response
         intel = self._parse_intel_response(response_text, provider, model)
@@ -334,7 +539,7 @@ Be specific and actionable. This will be used by senior executives to make inves
         """Parse LLM response into ProductRoadmapIntel model."""
         
         # Extract JSON from response
-        json_match = re.search(r'```(?:json)?\s*(\{.*?\})\s*```', response_text, re.DOTALL)
+        json_match = _JSON_BLOCK_RE.search(response_text)
         if json_match:
             json_str = json_match.group(1)
         else:
@@ -349,8 +554,8 @@ Be specific and actionable. This will be used by senior executives to make inves
         try:
             data = json.loads(json_str)
         except json.JSONDecodeError as e:
-            print(f"JSON parse error: {e}")
-            print(f"Attempted to parse: {json_str[:500]}...")
+            logger.warning("JSON parse error: %s", e)
+            logger.debug("Attempted to parse: %s...", json_str[:500])
             raise ValueError(f"Failed to parse LLM response as JSON: {e}")
         
         # Build competitive analysis
@@ -442,14 +647,23 @@ Be specific and actionable. This will be used by senior executives to make inves
     
     def delete_intel(self) -> bool:
         """Delete the cached intel."""
-        if self._intel_file.exists():
-            self._intel_file.unlink()
-            self._intel = None
-            return True
-        return False
+        if self._intel is None:
+            return False
+        self._db_delete("product_roadmap_intel")
+        self._intel = None
+        return True
+
+
+# Singleton instance
+_service: Optional[ProductRoadmapService] = None
 
 
 def get_product_roadmap_service() -> ProductRoadmapService:
     """Get the singleton product roadmap service instance."""
-    return ProductRoadmapService()
+    global _service
+    if _service is None:
+        _service = ProductRoadmapService()
+        # Close the shared HTTP clients once, at interpreter exit
+        atexit.register(_service.close)
+    return _service
 
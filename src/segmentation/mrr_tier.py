@@ -1,6 +1,8 @@
 """MRR-tier classification logic."""
 
-from typing import List, Optional
+import math
+from bisect import bisect_right
+from typing import Iterable, List, Optional, Tuple
 from pydantic import BaseModel, Field
 
 from src.data_model.models import Account, MRRTier
@@ -69,6 +71,26 @@ class MRRTierClassifier:
         self.boundaries = boundaries or self.DEFAULT_BOUNDARIES
         # Sort by min_mrr ascending
         self.boundaries = sorted(self.boundaries, key=lambda b: b.min_mrr)
+        self._validate_boundaries(self.boundaries)
+        # Parallel lookup arrays for binary search
+        self._mins: List[float] = [b.min_mrr for b in self.boundaries]
+        self._maxes: List[Optional[float]] = [b.max_mrr for b in self.boundaries]
+        self._tiers: List[MRRTier] = [b.tier for b in self.boundaries]
+        self._tier_info: dict[MRRTier, TierBoundary] = {}
+        for boundary in self.boundaries:
+            # First match wins, as with the previous linear scan
+            self._tier_info.setdefault(boundary.tier, boundary)
+
+    @staticmethod
+    def _validate_boundaries(boundaries: List[TierBoundary]) -> None:
+        """Raise ValueError if sorted boundaries overlap (classify assumes they don't)."""
+        for current, following in zip(boundaries, boundaries[1:]):
+            if current.max_mrr is None or current.max_mrr > following.min_mrr:
+                raise ValueError(
+                    f"MRR tier boundaries overlap: {current.tier.value} "
+                    f"[{current.min_mrr}, {current.max_mrr}) and {following.tier.value} "
+                    f"[{following.min_mrr}, {following.max_mrr})"
+                )
 
     def classify(self, mrr_usd: float) -> MRRTier:
         """
@@ -80,21 +102,28 @@ class MRRTierClassifier:
         Returns:
             The MRRTier for the given MRR
         """
+        if math.isnan(mrr_usd):
+            # NaN matches no boundary; use the fallback below
+            return MRRTier.TIER_E1
+
         if mrr_usd < self.ENTERPRISE_THRESHOLD:
             return MRRTier.NON_ENTERPRISE
 
-        for boundary in self.boundaries:
-            if boundary.max_mrr is None:
-                # Top tier (no upper bound)
-                if mrr_usd >= boundary.min_mrr:
-                    return boundary.tier
-            else:
-                if boundary.min_mrr <= mrr_usd < boundary.max_mrr:
-                    return boundary.tier
+        # Last boundary whose min_mrr <= mrr_usd; the top tier has no max_mrr
+        i = bisect_right(self._mins, mrr_usd) - 1
+        if i >= 0:
+            max_mrr = self._maxes[i]
+            if max_mrr is None or mrr_usd < max_mrr:
+                return self._tiers[i]
 
         # Fallback (shouldn't happen with proper boundaries)
         return MRRTier.TIER_E1
 
+    def classify_many(self, mrrs: Iterable[float]) -> List[MRRTier]:
+        """Classify a sequence of MRR values into tiers (see `classify`)."""
+        classify = self.classify
+        return [classify(mrr_usd) for mrr_usd in mrrs]
+
     def classify_account(self, account: Account) -> Account:
         """
         Update an account's MRR tier classification.
@@ -111,10 +140,7 @@ class MRRTierClassifier:
 
     def get_tier_info(self, tier: MRRTier) -> Optional[TierBoundary]:
         """Get the boundary definition for a tier."""
-        for boundary in self.boundaries:
-            if boundary.tier == tier:
-                return boundary
-        return None
+        return self._tier_info.get(tier)
 
     def get_enterprise_accounts(self, accounts: List[Account]) -> List[Account]:
         """Filter to enterprise accounts only."""
@@ -125,9 +151,34 @@ class MRRTierClassifier:
         result: dict[MRRTier, List[Account]] = {tier.tier: [] for tier in self.boundaries}
         result[MRRTier.NON_ENTERPRISE] = []
 
-        for account in accounts:
-            tier = self.classify(account.mrr_usd)
+        tiers = self.classify_many(a.mrr_usd for a in accounts)
+        for account, tier in zip(accounts, tiers):
             result[tier].append(account)
 
         return result
 
+    def classify_and_segment(
+        self, accounts: List[Account]
+    ) -> Tuple[List[Account], dict[MRRTier, List[Account]]]:
+        """
+        Classify accounts and group them by MRR tier in one pass.
+
+        Returns the classified accounts (as `classify_account` would) and the
+        same grouping as `segment_accounts`. Accounts whose tier and
+        enterprise flag are already correct are reused rather than copied.
+        """
+        result: dict[MRRTier, List[Account]] = {tier.tier: [] for tier in self.boundaries}
+        result[MRRTier.NON_ENTERPRISE] = []
+        classified: List[Account] = []
+
+        tiers = self.classify_many(a.mrr_usd for a in accounts)
+        for account, tier in zip(accounts, tiers):
+            is_enterprise = tier != MRRTier.NON_ENTERPRISE
+            if account.mrr_tier != tier or account.is_enterprise != is_enterprise:
+                account = account.model_copy(
+                    update={"mrr_tier": tier, "is_enterprise": is_enterprise}
+                )
+            classified.append(account)
+            result[tier].append(account)
+
+        return classified, result
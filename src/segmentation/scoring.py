@@ -5,7 +5,20 @@ from enum import Enum
 from pydantic import BaseModel, Field
 from datetime import datetime
 
-from src.data_model.models import Account, ProductCategory
+from src.data_model.models import Account, MRRTier, ProductCategory
+
+
+# MRR ceiling per tier, used to estimate headroom for growth scoring
+_TIER_CEILINGS: dict[MRRTier, int] = {
+    MRRTier.TIER_E1: 10000,
+    MRRTier.TIER_E2: 50000,
+    MRRTier.TIER_E3: 250000,
+    MRRTier.TIER_E4: 1000000,
+    MRRTier.TIER_E5: 5000000,  # Soft ceiling for scoring
+}
+
+# Tiers more likely to buy bundles
+_ENTERPRISE_BUYER_TIERS = frozenset({MRRTier.TIER_E3, MRRTier.TIER_E4, MRRTier.TIER_E5})
 
 
 class ScoreType(str, Enum):
@@ -62,14 +75,7 @@ class AccountScorer:
         factors: List[str] = []
 
         # Headroom within tier
-        tier_ceilings = {
-            "tier_e1": 10000,
-            "tier_e2": 50000,
-            "tier_e3": 250000,
-            "tier_e4": 1000000,
-            "tier_e5": 5000000,  # Soft ceiling for scoring
-        }
-        ceiling = tier_ceilings.get(account.mrr_tier.value, 10000)
+        ceiling = _TIER_CEILINGS.get(account.mrr_tier, 10000)
         headroom_pct = 1 - (account.mrr_usd / ceiling) if ceiling > 0 else 0
         if headroom_pct > 0.5:
             score += 0.2
@@ -215,7 +221,7 @@ class AccountScorer:
             factors = ["fully_bundled"]
 
         # Enterprise tier bonus (higher tiers more likely to buy bundles)
-        if account.mrr_tier.value in ("tier_e3", "tier_e4", "tier_e5"):
+        if account.mrr_tier in _ENTERPRISE_BUYER_TIERS:
             score += 0.10
             factors.append("enterprise_buyer_profile")
 
@@ -73,30 +73,32 @@ class SegmentViewBuilder:
 
         # Add score averages if provided
         if scores:
-            growth_scores = []
-            churn_scores = []
-            attach_scores = []
-            priority_scores = []
+            growth_sum = churn_sum = attach_sum = 0.0
+            growth_n = churn_n = attach_n = 0
+            high_priority = 0
 
             for account_scores in scores.values():
                 for s in account_scores:
-                    if s.score_type == ScoreType.GROWTH_POTENTIAL:
-                        growth_scores.append(s.score)
-                    elif s.score_type == ScoreType.CHURN_RISK:
-                        churn_scores.append(s.score)
-                    elif s.score_type == ScoreType.ATTACH_PROPENSITY:
-                        attach_scores.append(s.score)
-                    elif s.score_type == ScoreType.OVERALL_PRIORITY:
-                        priority_scores.append(s.score)
-
-            if growth_scores:
-                summary.avg_growth_potential = sum(growth_scores) / len(growth_scores)
-            if churn_scores:
-                summary.avg_churn_risk = sum(churn_scores) / len(churn_scores)
-            if attach_scores:
-                summary.avg_attach_propensity = sum(attach_scores) / len(attach_scores)
-            if priority_scores:
-                summary.high_priority_accounts = sum(1 for s in priority_scores if s > 0.7)
+                    score_type = s.score_type
+                    if score_type == ScoreType.GROWTH_POTENTIAL:
+                        growth_sum += s.score
+                        growth_n += 1
+                    elif score_type == ScoreType.CHURN_RISK:
+                        churn_sum += s.score
+                        churn_n += 1
+                    elif score_type == ScoreType.ATTACH_PROPENSITY:
+                        attach_sum += s.score
+                        attach_n += 1
+                    elif score_type == ScoreType.OVERALL_PRIORITY and s.score > 0.7:
+                        high_priority += 1
+
+            if growth_n:
+                summary.avg_growth_potential = growth_sum / growth_n
+            if churn_n:
+                summary.avg_churn_risk = churn_sum / churn_n
+            if attach_n:
+                summary.avg_attach_propensity = attach_sum / attach_n
+            summary.high_priority_accounts = high_priority
 
             # Estimate expansion opportunity (headroom * avg attach propensity)
             if tier_info and summary.avg_attach_propensity:
@@ -120,8 +122,7 @@ class SegmentViewBuilder:
     ) -> List[SegmentView]:
         """Build views for all enterprise segments."""
         # Classify and segment accounts
-        classified = [self.classifier.classify_account(a) for a in accounts]
-        segmented = self.classifier.segment_accounts(classified)
+        _, segmented = self.classifier.classify_and_segment(accounts)
 
         views = []
         for tier in [MRRTier.TIER_E1, MRRTier.TIER_E2, MRRTier.TIER_E3, MRRTier.TIER_E4, MRRTier.TIER_E5]:
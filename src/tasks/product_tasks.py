@@ -7,18 +7,20 @@ from src.celery_app import celery_app
 def generate_product_roadmap(self, job_id: str, force: bool = False):
     """Generate product competitiveness and roadmap analysis."""
     from src.jobs.queue import get_job_queue
-    from src.product_roadmap.service import ProductRoadmapService
+    from src.product_roadmap.service import get_product_roadmap_service
 
     queue = get_job_queue()
 
     try:
         queue.start_job(job_id)
-        queue.update_progress(job_id, 20, "Analyzing product portfolio...")
 
-        service = ProductRoadmapService()
-        intel = service.generate_intel(force_refresh=force)
+        service = get_product_roadmap_service()
+        queue.update_progress(job_id, 50, "Calling LLM for competitive analysis...")
+        intel = service.generate_intel(
+            force_refresh=force,
+            on_progress=lambda pct, message: queue.update_progress(job_id, pct, message),
+        )
 
-        queue.update_progress(job_id, 90, "Saving roadmap analysis...")
         queue.complete_job(job_id, {
             "status": "completed" if intel else "no_data",
         })
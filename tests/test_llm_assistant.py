@@ -0,0 +1,93 @@
+"""Tests for the playbook LLM assistant generation cache."""
+
+import asyncio
+
+from src.playbook.llm_assistant import LLMGenerationRequest, LLMPlaybookAssistant
+
+
+class _FakeKnowledgeBase:
+    """Knowledge base stand-in with no documents to retrieve."""
+
+    def __init__(self, chunks: int = 0):
+        self.chunks = chunks
+
+    def chunk_count(self) -> int:
+        return self.chunks
+
+    def query_batch(self, queries, n_results=5):
+        return [[] for _ in queries]
+
+
+def _request() -> LLMGenerationRequest:
+    return LLMGenerationRequest(
+        prompt_template_id="segment_overview",
+        section_type="segment_overview",
+        context={
+            "tier_label": "E3",
+            "account_count": 10,
+            "total_arr": 1_000_000,
+            "avg_mrr": 8_000,
+            "growth_potential": 0.6,
+            "churn_risk": 0.2,
+        },
+    )
+
+
+def _generate(assistant: LLMPlaybookAssistant, request: LLMGenerationRequest):
+    return asyncio.run(assistant.generate(request))
+
+
+def test_cache_is_opt_in():
+    assistant = LLMPlaybookAssistant()
+    assert assistant.cache is None
+    assert assistant.resume([_request()]) == [None]
+
+
+def test_repeat_request_is_served_from_cache(tmp_path):
+    assistant = LLMPlaybookAssistant(cache_dir=str(tmp_path))
+    first = _generate(assistant, _request())
+    second = _generate(assistant, _request())
+    assert second == first
+
+
+def test_editing_template_invalidates_cache(tmp_path):
+    assistant = LLMPlaybookAssistant(cache_dir=str(tmp_path))
+    first = _generate(assistant, _request())
+
+    assistant._prompt_registry["segment_overview"] += "\nKeep it under 200 words."
+
+    assert assistant.resume([_request()]) == [None]
+    assert _generate(assistant, _request()).generated_at != first.generated_at
+
+
+def test_ingesting_documents_invalidates_cache(tmp_path):
+    knowledge_base = _FakeKnowledgeBase(chunks=5)
+    assistant = LLMPlaybookAssistant(knowledge_base=knowledge_base, cache_dir=str(tmp_path))
+    _generate(assistant, _request())
+    assert assistant.resume([_request()])[0] is not None
+
+    knowledge_base.chunks = 8
+
+    assert assistant.resume([_request()]) == [None]
+
+
+def test_resume_returns_completed_results_in_order(tmp_path):
+    assistant = LLMPlaybookAssistant(cache_dir=str(tmp_path))
+    done = _request()
+    todo = done.model_copy(update={"temperature": 0.2})
+    result = _generate(assistant, done)
+
+    assert assistant.resume([todo, done]) == [None, result]
+
+
+def test_missing_context_reports_first_field_in_template_order():
+    assistant = LLMPlaybookAssistant()
+    request = LLMGenerationRequest(
+        prompt_template_id="segment_overview",
+        section_type="segment_overview",
+        context={"tier_label": "E3", "account_count": 10},
+    )
+    result = _generate(assistant, request)
+    # total_arr is the next field in the template, though avg_mrr sorts first
+    assert result.content == "[Missing context key: 'total_arr']"
+    assert result.model == "none"
@@ -0,0 +1,62 @@
+"""Tests for MRR tier classification."""
+
+import math
+
+import pytest
+
+from src.data_model.models import MRRTier
+from src.segmentation.mrr_tier import MRRTierClassifier, TierBoundary
+
+
+def _boundary(tier: MRRTier, min_mrr: float, max_mrr=None) -> TierBoundary:
+    return TierBoundary(tier=tier, min_mrr=min_mrr, max_mrr=max_mrr, label=tier.value, description="")
+
+
+def test_classify_default_boundaries():
+    classifier = MRRTierClassifier()
+    assert classifier.classify(1499.99) == MRRTier.NON_ENTERPRISE
+    assert classifier.classify(1500) == MRRTier.TIER_E1
+    assert classifier.classify(10000) == MRRTier.TIER_E2
+    assert classifier.classify(249999) == MRRTier.TIER_E3
+    assert classifier.classify(1_000_000) == MRRTier.TIER_E5
+
+
+def test_classify_gap_falls_back_to_e1():
+    classifier = MRRTierClassifier([
+        _boundary(MRRTier.TIER_E2, 5000, 8000),
+        _boundary(MRRTier.TIER_E3, 20000),
+    ])
+    assert classifier.classify(1600) == MRRTier.TIER_E1
+    assert classifier.classify(7999) == MRRTier.TIER_E2
+    assert classifier.classify(8000) == MRRTier.TIER_E1
+    assert classifier.classify(20000) == MRRTier.TIER_E3
+
+
+def test_overlapping_boundaries_are_rejected():
+    with pytest.raises(ValueError):
+        MRRTierClassifier([
+            _boundary(MRRTier.TIER_E1, 1500, 100000),
+            _boundary(MRRTier.TIER_E2, 10000, 50000),
+            _boundary(MRRTier.TIER_E5, 1_000_000),
+        ])
+
+
+def test_unbounded_boundary_must_be_last():
+    with pytest.raises(ValueError):
+        MRRTierClassifier([
+            _boundary(MRRTier.TIER_E1, 1500),
+            _boundary(MRRTier.TIER_E5, 1_000_000),
+        ])
+
+
+def test_non_finite_mrr():
+    classifier = MRRTierClassifier()
+    assert classifier.classify(math.nan) == MRRTier.TIER_E1
+    assert classifier.classify(math.inf) == MRRTier.TIER_E5
+    assert classifier.classify(-math.inf) == MRRTier.NON_ENTERPRISE
+
+
+def test_classify_many_matches_classify():
+    classifier = MRRTierClassifier()
+    values = [0, 1500, 9999.99, 50000, 999_999, 5_000_000, math.nan, math.inf]
+    assert classifier.classify_many(values) == [classifier.classify(v) for v in values]
@@ -0,0 +1,43 @@
+"""Tests for playbook data models."""
+
+from src.playbook.models import Playbook, PlaybookSection
+
+
+def _playbook() -> Playbook:
+    return Playbook(
+        id="pb_1",
+        name="Test Playbook",
+        description="Test",
+        playbook_type="segment_playbook",
+        sections=[
+            PlaybookSection(id="s1", title="Summary", section_type="executive_summary"),
+            PlaybookSection(id="s2", title="ICP", section_type="icp"),
+            PlaybookSection(id="s3", title="More ICP", section_type="icp"),
+        ],
+    )
+
+
+def test_get_section_returns_first_match():
+    pb = _playbook()
+    assert pb.get_section("icp").id == "s2"
+    assert pb.get_section("missing") is None
+
+
+def test_get_section_after_replacing_section():
+    pb = _playbook()
+    assert pb.get_section("executive_summary").id == "s1"
+
+    pb.sections[0] = pb.sections[0].model_copy(update={"section_type": "custom"})
+
+    assert pb.get_section("custom") is pb.sections[0]
+    assert pb.get_section("executive_summary") is None
+
+
+def test_get_section_after_in_place_edit():
+    pb = _playbook()
+    assert pb.get_section("icp").id == "s2"
+
+    pb.sections[1].section_type = "plays"
+
+    assert pb.get_section("plays").id == "s2"
+    assert pb.get_section("icp").id == "s3"
@@ -0,0 +1,49 @@
+"""Tests for the playbook template registry."""
+
+from src.playbook.templates import PlaybookTemplate, TemplateRegistry
+
+
+def test_list_all_builds_default_templates_in_order():
+    registry = TemplateRegistry()
+    templates = registry.list_all()
+
+    assert [t.id for t in templates] == ["enterprise_strategy", "segment_playbook"]
+    for template in templates:
+        assert template.sections
+        assert registry.get(template.id) is template
+
+
+def test_get_builds_only_the_requested_default():
+    registry = TemplateRegistry()
+    template = registry.get("enterprise_strategy")
+
+    assert template.id == "enterprise_strategy"
+    assert "enterprise_strategy" in registry._templates
+    # The other default has not been built yet
+    assert "segment_playbook" in registry._builders
+    assert "segment_playbook" not in registry._templates
+    assert registry.get("missing") is None
+
+
+def test_register_replaces_default_and_appends_new():
+    registry = TemplateRegistry()
+    registry.list_all()
+
+    replacement = PlaybookTemplate(
+        id="segment_playbook",
+        name="Custom Segment Playbook",
+        description="Replacement",
+        playbook_type="segment_playbook",
+    )
+    custom = PlaybookTemplate(
+        id="custom",
+        name="Custom",
+        description="New template",
+        playbook_type="custom",
+    )
+    registry.register(replacement)
+    registry.register(custom)
+
+    templates = registry.list_all()
+    assert [t.id for t in templates] == ["enterprise_strategy", "segment_playbook", "custom"]
+    assert templates[1] is replacement
@@ -0,0 +1,50 @@
+"""Tests for Product Roadmap route caching headers."""
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.product_roadmap import routes
+from src.product_roadmap.models import ProductRoadmapIntel
+from src.product_roadmap.service import get_product_roadmap_service
+
+
+@pytest.fixture
+def client_and_service():
+    service = get_product_roadmap_service()
+    original = service._intel
+    service._intel = ProductRoadmapIntel()
+    app = FastAPI()
+    app.include_router(routes.router)
+    yield TestClient(app), service
+    service._intel = original
+
+
+def test_etag_is_derived_from_given_intel():
+    service = get_product_roadmap_service()
+    first, second = ProductRoadmapIntel(), ProductRoadmapIntel()
+    assert service.get_intel_etag(first) == service.get_intel_etag(first)
+    assert service.get_intel_etag(first) != service.get_intel_etag(second)
+    assert service.get_intel_etag(None) is None
+
+
+@pytest.mark.parametrize("path", ["intel", "summary", "recommendations", "competitive-analysis"])
+def test_if_none_match(client_and_service, path):
+    client, service = client_and_service
+    url = f"/api/product-roadmap/{path}"
+    response = client.get(url)
+    etag = response.headers["etag"]
+    assert etag == service.get_intel_etag(service.get_intel())
+
+    assert client.get(url, headers={"If-None-Match": f'"other", {etag}'}).status_code == 304
+    assert client.get(url, headers={"If-None-Match": f"W/{etag}"}).status_code == 304
+    assert client.get(url, headers={"If-None-Match": "*"}).status_code == 304
+    assert client.get(url, headers={"If-None-Match": '"other"'}).status_code == 200
+
+
+def test_no_intel_ignores_if_none_match(client_and_service):
+    client, service = client_and_service
+    service._intel = None
+    response = client.get("/api/product-roadmap/intel", headers={"If-None-Match": "*"})
+    assert response.status_code == 200
+    assert "etag" not in response.headers